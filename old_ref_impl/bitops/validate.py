@@ -20,7 +20,9 @@ from genfxn.core.codegen import task_id_from_spec
 from genfxn.core.models import Task
 from genfxn.core.safe_exec import (
     SafeExecMissingFunctionError,
+    call_batch,
     execute_code_restricted,
+    parse_code,
 )
 from genfxn.core.task_ids import validate_task_ids
 from genfxn.core.validate import WRONG_FAMILY, Issue, Severity
@@ -58,7 +60,7 @@ def _validate_ast_whitelist(
     issues: list[Issue] = []
 
     try:
-        tree = ast.parse(code)
+        tree = parse_code(code)
     except (SyntaxError, TypeError):
         return [], None
 
@@ -310,7 +312,7 @@ def _validate_code_compile(
 
     if parsed_tree is None:
         try:
-            parsed_tree = ast.parse(code)
+            parsed_tree = parse_code(code)
         except (SyntaxError, TypeError) as e:
             return [
                 Issue(
@@ -438,18 +440,21 @@ def _validate_semantics(
     severity = Severity.ERROR if strict else Severity.WARNING
     lo, hi = _DEFAULT_VALUE_RANGE
 
+    cases: list[tuple[int, int]] = []
     for _ in range(semantic_trials):
         x = rng.randint(lo, hi)
-        expected = eval_bitops(spec, x)
+        cases.append((x, eval_bitops(spec, x)))
 
-        try:
-            actual = fn(x)
-        except Exception as e:
+    outcomes = call_batch(fn, [(x,) for x, _ in cases])
+    for (x, expected), actual in zip(cases, outcomes, strict=True):
+        if isinstance(actual, Exception):
             issues.append(
                 Issue(
                     code=CODE_CODE_RUNTIME_ERROR,
                     severity=severity,
-                    message=f"Code raised runtime error for input {x}: {e}",
+                    message=(
+                        f"Code raised runtime error for input {x}: {actual}"
+                    ),
                     location="code",
                     task_id=task.task_id,
                 )
@@ -3,14 +3,24 @@ from __future__ import annotations
 import ast
 import atexit
 import errno
+import hashlib
+import itertools
+import json
 import logging
 import math
 import multiprocessing as mp
 import os
 import pickle
 import signal
+import sys
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
+from functools import lru_cache
+from multiprocessing import forkserver, resource_tracker, shared_memory
+from pathlib import Path
 from queue import Empty
 from typing import Any, cast
 
@@ -52,26 +62,146 @@ class _WorkerResult:
     value: Any = None
     error_type: str | None = None
     error_message: str | None = None
+    # Set when the pickled result was too large for the pipe and sits in
+    # the request's result_segment instead (see _put_result_payload).
+    segment_size: int | None = None
 
 
 @dataclass
 class _WorkerRequest:
     kind: str
     call_args: tuple[Any, ...] | None = None
+    code: str | None = None
+    allowed_builtins: dict[str, Any] | None = None
+    max_result_bytes: int | None = None
+    call_args_list: list[tuple[Any, ...]] | None = None
+    per_call_timeout: float | None = None
+    total_timeout: float | None = None
+    # Shared memory segment the worker may create for a large result.
+    result_segment: str | None = None
+
+
+# Bump whenever _static_validation_error changes what it accepts, so
+# verdicts cached by an older validator are not reused.
+_STATIC_VALIDATOR_VERSION = 2
+_VALIDATION_CACHE_ENV = "GENFXN_SAFE_EXEC_VALIDATION_CACHE"
+_DEFAULT_VALIDATION_CACHE_ENTRIES = 4_096
+
+
+class _ValidationCache:
+    """Content-addressed cache of static validation verdicts.
+
+    A verdict is None (accepted) or the rejection message, keyed by the
+    sha256 of the validator version, the Python version (ast.parse
+    accepts different syntax per release) and the code. Recent verdicts
+    live in an in-memory LRU; with cache_dir set they also persist
+    across runs, one small JSON file per key. Anyone who can write to
+    cache_dir can mark code as accepted, so it must be trusted.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, str | None] = OrderedDict()
+        self.max_entries = _DEFAULT_VALIDATION_CACHE_ENTRIES
+        cache_dir = os.environ.get(_VALIDATION_CACHE_ENV)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+    @staticmethod
+    def key(code: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(
+            f"{_STATIC_VALIDATOR_VERSION}:"
+            f"{sys.version_info.major}.{sys.version_info.minor}\0".encode()
+        )
+        digest.update(code.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> tuple[bool, str | None]:
+        """Return (hit, verdict)."""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return True, self._entries[key]
+        if self.cache_dir is None:
+            return False, None
+        try:
+            record = json.loads(self._path(key).read_text(encoding="utf-8"))
+            verdict = record["error"]
+        except (OSError, ValueError, TypeError, KeyError):
+            return False, None
+        if verdict is not None and not isinstance(verdict, str):
+            return False, None
+        self._remember(key, verdict)
+        return True, verdict
+
+    def put(self, key: str, verdict: str | None) -> None:
+        self._remember(key, verdict)
+        if self.cache_dir is None:
+            return
+        path = self._path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps({"error": verdict}), "utf-8")
+            os.replace(tmp_path, path)
+        except OSError as exc:
+            _LOGGER.debug("Could not persist validation verdict: %s", exc)
+            tmp_path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, verdict: str | None) -> None:
+        with self._lock:
+            self._entries[key] = verdict
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+
+_VALIDATION_CACHE = _ValidationCache()
+_PARSE_CACHE_ENTRIES = 256
+
+
+@lru_cache(maxsize=_PARSE_CACHE_ENTRIES)
+def parse_code(code: str) -> ast.Module:
+    """Return ``ast.parse(code)``, shared across callers by code text.
+
+    Family AST whitelists and this module's static validation both parse
+    the same task code; going through here parses it once. The tree is
+    always derived from code itself. Callers must not mutate it.
+    """
+    return ast.parse(code, mode="exec")
 
 
 def _validate_untrusted_code(code: str) -> None:
     """Best-effort static hardening for untrusted code.
 
     This is not a security sandbox. It blocks known-dangerous patterns but
-    cannot provide complete containment against Python escapes.
+    cannot provide complete containment against Python escapes. Verdicts
+    are cached by content (see _ValidationCache). A cached verdict always
+    comes from parsing code itself, never from a caller-supplied tree.
     """
+    key = _VALIDATION_CACHE.key(code)
+    hit, error = _VALIDATION_CACHE.get(key)
+    if not hit:
+        error = _static_validation_error(code)
+        _VALIDATION_CACHE.put(key, error)
+    if error is not None:
+        raise SafeExecValidationError(error)
+
+
+def _static_validation_error(code: str) -> str | None:
+    """Return why code is rejected, or None if it passes."""
     try:
-        tree = ast.parse(code, mode="exec")
+        tree = parse_code(code)
     except SyntaxError as exc:
-        raise SafeExecValidationError(
-            f"Invalid Python syntax at line {exc.lineno}: {exc.msg}"
-        ) from exc
+        return f"Invalid Python syntax at line {exc.lineno}: {exc.msg}"
 
     blocked_calls = {
         "__import__",
@@ -149,9 +279,8 @@ def _validate_untrusted_code(code: str) -> None:
         summary = "; ".join(unique[:3])
         if len(unique) > 3:
             summary += f"; ... ({len(unique)} issues)"
-        raise SafeExecValidationError(
-            f"Rejected by static validation: {summary}"
-        )
+        return f"Rejected by static validation: {summary}"
+    return None
 
 
 def _set_process_group() -> None:
@@ -247,11 +376,22 @@ def _set_memory_limit(memory_limit_mb: int | None) -> None:
 
 
 _SAFE_EXEC_START_METHOD_ENV = "GENFXN_SAFE_EXEC_START_METHOD"
+_SAFE_EXEC_PRELOAD_ENV = "GENFXN_SAFE_EXEC_PRELOAD"
 _DEFAULT_MAX_RESULT_BYTES = 1_000_000
 _RESULT_QUEUE_GRACE_SEC = 0.25
 _RESULT_QUEUE_POLL_SEC = 0.05
 _PERSISTENT_STARTUP_TIMEOUT_FLOOR_SEC = 1.0
 _MAX_RESULT_NESTING_DEPTH = 32
+_SAFE_EXEC_POOL_ENV = "GENFXN_SAFE_EXEC_POOL"
+_DEFAULT_MAX_CALLS_PER_WORKER = 10_000
+_DEFAULT_MAX_RSS_GROWTH_MB = 64
+_BATCH_DEADLINE_GRACE_SEC = 0.5
+_SAFE_EXEC_SHM_RESULTS_ENV = "GENFXN_SAFE_EXEC_SHM_RESULTS"
+# Pickled results at least this large (one Linux pipe buffer) go through
+# shared memory rather than the result queue's pipe.
+_SHM_RESULT_MIN_BYTES = 64 * 1024
+_PLAIN_SCALAR_TYPES = frozenset({type(None), bool, int, float, str})
+_RESULT_SEGMENT_IDS = itertools.count()
 
 
 def _persistent_startup_timeout_sec(timeout_sec: float) -> float:
@@ -331,6 +471,40 @@ def _should_map_startup_crash_to_bootstrap_error(method: str) -> bool:
     return _is_spawn_like_method(method) and not _has_importable_main_module()
 
 
+class _ForkserverPreload:
+    """Modules the forkserver imports once, before it forks any worker.
+
+    Workers unpickle their target from this module, so it (with the
+    stdlib it pulls in) is what every sandbox child would otherwise
+    import at startup. Extra modules come from configure_forkserver_preload
+    or a comma-separated ``GENFXN_SAFE_EXEC_PRELOAD``; ``=0`` turns
+    preloading off. Modules that fail to import are skipped by the
+    forkserver.
+    """
+
+    def __init__(self) -> None:
+        configured = os.environ.get(_SAFE_EXEC_PRELOAD_ENV, "")
+        self.enabled = configured != "0"
+        self.extra_modules = [
+            name.strip() for name in configured.split(",") if name.strip()
+        ]
+        self.applied = False
+
+    def apply(self, ctx: mp.context.BaseContext) -> None:
+        if self.applied:
+            return
+        self.applied = True
+        if not self.enabled:
+            return
+        # Keep preloads the host application set (default: __main__).
+        current = getattr(forkserver._forkserver, "_preload_modules", [])
+        modules = [*current, __name__, *self.extra_modules]
+        cast(Any, ctx).set_forkserver_preload(list(dict.fromkeys(modules)))
+
+
+_FORKSERVER_PRELOAD = _ForkserverPreload()
+
+
 def _get_mp_context() -> mp.context.BaseContext:
     """Return multiprocessing context suitable for safe_exec workers."""
     configured = os.environ.get(_SAFE_EXEC_START_METHOD_ENV)
@@ -343,16 +517,31 @@ def _get_mp_context() -> mp.context.BaseContext:
                 f"Invalid {_SAFE_EXEC_START_METHOD_ENV}={configured!r}. "
                 f"Valid values: {valid}"
             )
-        return mp.get_context(configured)
-
+        ctx = mp.get_context(configured)
     # Default to spawn/forkserver to avoid fork-safety issues in
     # multi-threaded hosts.
-    if os.name == "posix":
-        if "forkserver" in allowed:
-            return mp.get_context("forkserver")
-        if "spawn" in allowed:
-            return mp.get_context("spawn")
-    return mp.get_context("spawn")
+    elif os.name == "posix" and "forkserver" in allowed:
+        ctx = mp.get_context("forkserver")
+    else:
+        ctx = mp.get_context("spawn")
+
+    if ctx.get_start_method() == "forkserver":
+        _FORKSERVER_PRELOAD.apply(ctx)
+    return ctx
+
+
+def _load_function(
+    code: str, allowed_builtins: dict[str, Any]
+) -> Callable[..., Any]:
+    """Exec code in a fresh namespace and return its function ``f``."""
+    execution_env: dict[str, Any] = {"__builtins__": allowed_builtins}
+    exec(code, execution_env, execution_env)  # noqa: S102
+    func = execution_env.get("f")
+    if func is None:
+        raise NameError("Function 'f' not found in code namespace")
+    if not callable(func):
+        raise TypeError(f"Function 'f' is not callable: {type(func)}")
+    return func
 
 
 def _exec_worker(
@@ -365,15 +554,9 @@ def _exec_worker(
 ) -> None:
     _set_process_group()
     _set_memory_limit(memory_limit_mb)
-    execution_env: dict[str, Any] = {"__builtins__": allowed_builtins}
 
     try:
-        exec(code, execution_env, execution_env)  # noqa: S102
-        func = execution_env.get("f")
-        if func is None:
-            raise NameError("Function 'f' not found in code namespace")
-        if not callable(func):
-            raise TypeError(f"Function 'f' is not callable: {type(func)}")
+        func = _load_function(code, allowed_builtins)
 
         if call_args is None:
             _put_worker_result(
@@ -413,12 +596,18 @@ def _sanitize_worker_result_value(value: Any, depth: int = 0) -> Any:
     ):
         return value
 
+    # Flat sequences of plain scalars, the common large result, skip the
+    # per-item recursion.
     if isinstance(value, list):
+        if set(map(type, value)) <= _PLAIN_SCALAR_TYPES:
+            return list(value)
         return [
             _sanitize_worker_result_value(item, depth + 1) for item in value
         ]
 
     if isinstance(value, tuple):
+        if set(map(type, value)) <= _PLAIN_SCALAR_TYPES:
+            return tuple(value)
         return tuple(
             _sanitize_worker_result_value(item, depth + 1) for item in value
         )
@@ -443,11 +632,12 @@ def _sanitize_worker_result_value(value: Any, depth: int = 0) -> Any:
     raise TypeError(f"Unsupported worker result type: {type(value).__name__}")
 
 
-def _put_worker_result(
-    queue: mp.Queue,
+def _checked_worker_result(
     result: _WorkerResult,
     max_result_bytes: int | None,
-) -> None:
+) -> tuple[_WorkerResult, bytes | None]:
+    """Return result sanitized and size-checked with its pickle, or the
+    error to send with None."""
     sanitized_result = result
     if result.ok:
         try:
@@ -456,17 +646,14 @@ def _put_worker_result(
                 value=_sanitize_worker_result_value(result.value),
             )
         except Exception as exc:
-            queue.put(
-                _WorkerResult(
-                    ok=False,
-                    error_type="RuntimeError",
-                    error_message=(
-                        "Failed to serialize worker result: "
-                        f"{type(exc).__name__}: {exc}"
-                    ),
-                )
-            )
-            return
+            return _WorkerResult(
+                ok=False,
+                error_type="RuntimeError",
+                error_message=(
+                    "Failed to serialize worker result: "
+                    f"{type(exc).__name__}: {exc}"
+                ),
+            ), None
 
     # Always pre-serialize to surface serialization failures synchronously.
     # Otherwise Queue feeder-thread errors can be misreported as timeouts.
@@ -476,33 +663,202 @@ def _put_worker_result(
             protocol=pickle.HIGHEST_PROTOCOL,
         )
     except Exception as exc:
-        queue.put(
-            _WorkerResult(
+        return _WorkerResult(
+            ok=False,
+            error_type="RuntimeError",
+            error_message=(
+                "Failed to serialize worker result: "
+                f"{type(exc).__name__}: {exc}"
+            ),
+        ), None
+
+    if max_result_bytes is not None:
+        payload_size = len(payload)
+        if payload_size > max_result_bytes:
+            return _WorkerResult(
                 ok=False,
                 error_type="RuntimeError",
                 error_message=(
-                    "Failed to serialize worker result: "
-                    f"{type(exc).__name__}: {exc}"
+                    "Worker result exceeded max_result_bytes "
+                    f"({payload_size} > {max_result_bytes})"
                 ),
-            )
+            ), None
+    return sanitized_result, payload
+
+
+def _pickle_worker_result(result: _WorkerResult) -> bytes:
+    return pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _put_worker_result(
+    queue: mp.Queue,
+    result: _WorkerResult,
+    max_result_bytes: int | None,
+    result_segment: str | None = None,
+) -> None:
+    checked, payload = _checked_worker_result(result, max_result_bytes)
+    _put_result_payload(queue, checked, payload, result_segment)
+
+
+def _put_result_payload(
+    queue: mp.Queue,
+    result: _WorkerResult,
+    payload: bytes | None,
+    result_segment: str | None,
+) -> None:
+    """Send result, moving a large payload (its pickle) through shared
+    memory so only a small descriptor crosses the pipe."""
+    if (
+        result_segment is not None
+        and payload is not None
+        and len(payload) >= _SHM_RESULT_MIN_BYTES
+        and _write_result_segment(result_segment, payload)
+    ):
+        queue.put(_WorkerResult(ok=True, segment_size=len(payload)))
+        return
+    queue.put(result)
+
+
+def _write_result_segment(name: str, payload: bytes) -> bool:
+    """Copy payload into a new segment; False if none can be made."""
+    try:
+        # Writing past a full tmpfs raises SIGBUS rather than an error.
+        stats = os.statvfs("/dev/shm")
+        if stats.f_bavail * stats.f_frsize < 2 * len(payload):
+            return False
+    except OSError:
+        pass
+    try:
+        segment = shared_memory.SharedMemory(
+            name=name, create=True, size=len(payload)
         )
+    except Exception:
+        return False
+    # The parent owns and unlinks the segment; keep this process's
+    # resource tracker from unlinking it when the worker exits.
+    resource_tracker.unregister(
+        getattr(segment, "_name", segment.name), "shared_memory"
+    )
+    try:
+        segment.buf[: len(payload)] = payload
+    except Exception:
+        segment.unlink()
+        return False
+    finally:
+        segment.close()
+    return True
+
+
+def _read_result_segment(name: str, size: int) -> _WorkerResult:
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        with segment.buf[:size] as view:
+            return cast(_WorkerResult, pickle.loads(view))
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def _unlink_result_segment(name: str) -> None:
+    """Remove a segment a killed or crashed worker may have left."""
+    try:
+        segment = shared_memory.SharedMemory(name=name)
+    except (OSError, ValueError):
         return
+    segment.close()
+    segment.unlink()
 
-    if max_result_bytes is not None:
-        payload_size = len(payload)
-        if payload_size > max_result_bytes:
-            queue.put(
-                _WorkerResult(
+
+class _CallTimeoutError(BaseException):
+    """Raised in a worker by SIGALRM when one batched call overruns.
+
+    A BaseException so ``except Exception`` in user code cannot swallow it.
+    """
+
+
+def _raise_call_timeout(signum: int, frame: Any) -> None:
+    raise _CallTimeoutError
+
+
+def _run_call_batch(
+    func: Callable[..., Any],
+    call_args_list: list[tuple[Any, ...]],
+    per_call_timeout: float,
+    total_timeout: float,
+    max_result_bytes: int | None,
+) -> tuple[list[bytes], int]:
+    """Call func on each args tuple, timing out items individually.
+
+    Returns each item's pickled _WorkerResult and their total size. The
+    pickles made for the max_result_bytes check are sent as they are, so
+    sending the batch copies bytes instead of pickling every value again.
+    Per-item timeouts use SIGALRM where available; elsewhere only the
+    parent's batch deadline applies. Once an item times out, or the
+    batch deadline passes, the remaining items time out without running,
+    so a batch of hung calls costs one timeout rather than one per item.
+    """
+    use_alarm = hasattr(signal, "setitimer")
+    previous_handler: Any = None
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, _raise_call_timeout)
+    deadline = time.monotonic() + total_timeout
+    payloads: list[bytes] = []
+    payload_bytes = 0
+    skip_message: str | None = None
+    try:
+        for args in call_args_list:
+            remaining = deadline - time.monotonic()
+            if skip_message is None and remaining <= 0:
+                skip_message = (
+                    "Batched code execution timed out after "
+                    f"{total_timeout} seconds"
+                )
+            if skip_message is not None:
+                result = _WorkerResult(
                     ok=False,
-                    error_type="RuntimeError",
+                    error_type=SafeExecTimeoutError.__name__,
+                    error_message=skip_message,
+                )
+                payloads.append(_pickle_worker_result(result))
+                continue
+            try:
+                if use_alarm:
+                    signal.setitimer(
+                        signal.ITIMER_REAL, min(per_call_timeout, remaining)
+                    )
+                try:
+                    result = _WorkerResult(ok=True, value=func(*args))
+                finally:
+                    if use_alarm:
+                        signal.setitimer(signal.ITIMER_REAL, 0)
+            except _CallTimeoutError:
+                result = _WorkerResult(
+                    ok=False,
+                    error_type=SafeExecTimeoutError.__name__,
                     error_message=(
-                        "Worker result exceeded max_result_bytes "
-                        f"({payload_size} > {max_result_bytes})"
+                        "Code execution timed out after "
+                        f"{per_call_timeout} seconds"
                     ),
                 )
-            )
-            return
-    queue.put(sanitized_result)
+                skip_message = (
+                    "Skipped after an earlier call in the batch timed out "
+                    f"after {per_call_timeout} seconds"
+                )
+            except Exception as exc:
+                result = _WorkerResult(
+                    ok=False,
+                    error_type=type(exc).__name__,
+                    error_message=str(exc),
+                )
+            checked, payload = _checked_worker_result(result, max_result_bytes)
+            if payload is None:
+                payload = _pickle_worker_result(checked)
+            payloads.append(payload)
+            payload_bytes += len(payload)
+    finally:
+        if use_alarm:
+            signal.signal(signal.SIGALRM, previous_handler)
+    return payloads, payload_bytes
 
 
 def _run_isolated(
@@ -597,19 +953,67 @@ class _IsolatedFunction:
         max_result_bytes: int | None = _DEFAULT_MAX_RESULT_BYTES,
     ) -> None:
         self._closed = False
-        self._worker = _PersistentWorker(
-            code=code,
-            allowed_builtins=allowed_builtins,
-            memory_limit_mb=memory_limit_mb,
-            timeout_sec=timeout_sec,
-            max_result_bytes=max_result_bytes,
+        self._worker = _WORKER_POOL.acquire(
+            memory_limit_mb=memory_limit_mb, timeout_sec=timeout_sec
         )
+        try:
+            self._worker.load(
+                code,
+                allowed_builtins,
+                timeout_sec=timeout_sec,
+                max_result_bytes=max_result_bytes,
+            )
+        except BaseException:
+            # Load failures leave a live worker reusable; timeouts have
+            # already terminated it.
+            self._closed = True
+            _WORKER_POOL.release(self._worker)
+            raise
         self._timeout_sec = timeout_sec
         atexit.register(self.close)
 
     def __call__(self, *args: Any) -> Any:
+        if self._closed:
+            # The worker may already serve another function.
+            raise RuntimeError("Isolated function is closed")
         return self._worker.call(args, self._timeout_sec)
 
+    def call_many(
+        self,
+        call_args_list: Sequence[tuple[Any, ...]],
+        per_call_timeout: float | None = None,
+        total_timeout: float | None = None,
+    ) -> list[Any]:
+        """Call f on each args tuple in one worker round trip.
+
+        Returns values and per-call SafeExec* exceptions in order. The
+        first call to time out stops the batch: every later call gets a
+        SafeExecTimeoutError without running. per_call_timeout defaults
+        to this function's timeout and total_timeout to per_call_timeout
+        times the batch size.
+        """
+        if self._closed:
+            raise RuntimeError("Isolated function is closed")
+        if per_call_timeout is None:
+            per_call_timeout = self._timeout_sec
+        if total_timeout is None:
+            total_timeout = per_call_timeout * max(1, len(call_args_list))
+        _validate_execution_limits(
+            timeout_sec=per_call_timeout,
+            memory_limit_mb=None,
+            max_result_bytes=None,
+        )
+        _validate_execution_limits(
+            timeout_sec=total_timeout,
+            memory_limit_mb=None,
+            max_result_bytes=None,
+        )
+        return self._worker.call_many(
+            [tuple(args) for args in call_args_list],
+            per_call_timeout,
+            total_timeout,
+        )
+
     def close(self) -> None:
         if self._closed:
             return
@@ -621,7 +1025,7 @@ class _IsolatedFunction:
                 "safe_exec cleanup: atexit.unregister() failed",
                 exc_info=True,
             )
-        self._worker.close()
+        _WORKER_POOL.release(self._worker)
 
     def __del__(self) -> None:
         try:
@@ -636,54 +1040,81 @@ class _IsolatedFunction:
 def _persistent_worker(
     request_queue: mp.Queue,
     response_queue: mp.Queue,
-    code: str,
-    allowed_builtins: dict[str, Any],
     memory_limit_mb: int | None,
-    max_result_bytes: int | None,
 ) -> None:
     _set_process_group()
     _set_memory_limit(memory_limit_mb)
-    execution_env: dict[str, Any] = {"__builtins__": allowed_builtins}
-
-    try:
-        exec(code, execution_env, execution_env)  # noqa: S102
-        func = execution_env.get("f")
-        if func is None:
-            raise NameError("Function 'f' not found in code namespace")
-        if not callable(func):
-            raise TypeError(f"Function 'f' is not callable: {type(func)}")
-        _put_worker_result(
-            response_queue,
-            _WorkerResult(ok=True, value=None),
-            max_result_bytes,
-        )
-    except Exception as exc:
-        _put_worker_result(
-            response_queue,
-            _WorkerResult(
-                ok=False,
-                error_type=type(exc).__name__,
-                error_message=str(exc),
-            ),
-            max_result_bytes,
-        )
-        return
+    # Signal readiness. Code arrives in "load" requests, so one warm
+    # worker serves many functions in turn, each in a fresh namespace.
+    _put_worker_result(response_queue, _WorkerResult(ok=True), None)
 
+    func: Callable[..., Any] | None = None
+    max_result_bytes: int | None = None
     while True:
         req: _WorkerRequest = request_queue.get()
         if req.kind == "shutdown":
             return
-        if req.kind != "call":
+        if req.kind == "load":
+            func = None
+            max_result_bytes = req.max_result_bytes
+            try:
+                func = _load_function(
+                    cast(str, req.code),
+                    cast(dict[str, Any], req.allowed_builtins),
+                )
+                _put_worker_result(
+                    response_queue,
+                    _WorkerResult(ok=True, value=None),
+                    max_result_bytes,
+                )
+            except Exception as exc:
+                _put_worker_result(
+                    response_queue,
+                    _WorkerResult(
+                        ok=False,
+                        error_type=type(exc).__name__,
+                        error_message=str(exc),
+                    ),
+                    max_result_bytes,
+                )
+            continue
+        if req.kind not in ("call", "call_many") or func is None:
+            message = (
+                f"Unknown request kind: {req.kind}"
+                if req.kind not in ("call", "call_many")
+                else "No function loaded"
+            )
             _put_worker_result(
                 response_queue,
                 _WorkerResult(
                     ok=False,
                     error_type="RuntimeError",
-                    error_message=f"Unknown request kind: {req.kind}",
+                    error_message=message,
                 ),
                 max_result_bytes,
             )
             continue
+        if req.kind == "call_many":
+            # Items are checked and pickled one by one; the batch of
+            # pickles goes back as one message.
+            payloads, payload_bytes = _run_call_batch(
+                func,
+                req.call_args_list or [],
+                cast(float, req.per_call_timeout),
+                cast(float, req.total_timeout),
+                max_result_bytes,
+            )
+            batch = _WorkerResult(ok=True, value=payloads)
+            payload = None
+            if (
+                req.result_segment is not None
+                and payload_bytes >= _SHM_RESULT_MIN_BYTES
+            ):
+                payload = _pickle_worker_result(batch)
+            _put_result_payload(
+                response_queue, batch, payload, req.result_segment
+            )
+            continue
 
         try:
             args = req.call_args if req.call_args is not None else ()
@@ -691,6 +1122,7 @@ def _persistent_worker(
                 response_queue,
                 _WorkerResult(ok=True, value=func(*args)),
                 max_result_bytes,
+                req.result_segment,
             )
         except Exception as exc:
             _put_worker_result(
@@ -704,28 +1136,47 @@ def _persistent_worker(
             )
 
 
-def _raise_from_worker_result(result: _WorkerResult) -> None:
+def _error_from_worker_result(result: _WorkerResult) -> Exception:
     error_type = result.error_type or "RuntimeError"
     error_message = result.error_message or "Unknown execution error"
+    if error_type == SafeExecTimeoutError.__name__:
+        return SafeExecTimeoutError(error_message)
     if error_type == "NameError" and (
         error_message == "Function 'f' not found in code namespace"
     ):
-        raise SafeExecMissingFunctionError(error_type, error_message)
-    raise SafeExecExecutionError(error_type, error_message)
+        return SafeExecMissingFunctionError(error_type, error_message)
+    return SafeExecExecutionError(error_type, error_message)
+
+
+def _raise_from_worker_result(result: _WorkerResult) -> None:
+    raise _error_from_worker_result(result)
+
+
+def _process_rss_bytes(pid: int | None) -> int | None:
+    """Resident set size of a live process, or None where unavailable."""
+    if pid is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/statm", "rb") as statm:
+            resident_pages = int(statm.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
 
 
 class _PersistentWorker:
+    """A sandbox process that loads and calls one function at a time."""
+
     def __init__(
         self,
-        code: str,
-        allowed_builtins: dict[str, Any],
         memory_limit_mb: int | None,
         timeout_sec: float,
-        max_result_bytes: int | None = _DEFAULT_MAX_RESULT_BYTES,
     ) -> None:
         self._ctx = _get_mp_context()
         ctx_runtime = cast(Any, self._ctx)
         self._start_method = self._ctx.get_start_method()
+        self.memory_limit_mb = memory_limit_mb
+        self.calls = 0
         self._request_queue: mp.Queue = ctx_runtime.Queue()
         self._response_queue: mp.Queue = ctx_runtime.Queue()
         self._process = ctx_runtime.Process(
@@ -733,10 +1184,7 @@ class _PersistentWorker:
             args=(
                 self._request_queue,
                 self._response_queue,
-                code,
-                allowed_builtins,
                 memory_limit_mb,
-                max_result_bytes,
             ),
         )
         try:
@@ -748,9 +1196,7 @@ class _PersistentWorker:
 
         try:
             startup_timeout_sec = _persistent_startup_timeout_sec(timeout_sec)
-            init_result: _WorkerResult = self._response_queue.get(
-                timeout=startup_timeout_sec
-            )
+            self._response_queue.get(timeout=startup_timeout_sec)
         except Empty:
             self._terminate()
             if self._process.exitcode not in (None, 0):
@@ -772,38 +1218,166 @@ class _PersistentWorker:
                 "Code execution startup timed out after "
                 f"{startup_timeout_sec} seconds"
             )
+        self.baseline_rss_bytes = _process_rss_bytes(self._process.pid)
 
-        if not init_result.ok:
-            self._terminate()
-            _raise_from_worker_result(init_result)
+    @property
+    def pool_key(self) -> tuple[str, int | None]:
+        return self._start_method, self.memory_limit_mb
+
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def rss_bytes(self) -> int | None:
+        return _process_rss_bytes(self._process.pid)
+
+    def load(
+        self,
+        code: str,
+        allowed_builtins: dict[str, Any],
+        *,
+        timeout_sec: float,
+        max_result_bytes: int | None = _DEFAULT_MAX_RESULT_BYTES,
+    ) -> None:
+        """Exec code in a fresh namespace, replacing any loaded function."""
+        startup_timeout_sec = _persistent_startup_timeout_sec(timeout_sec)
+        result = self._request(
+            _WorkerRequest(
+                kind="load",
+                code=code,
+                allowed_builtins=allowed_builtins,
+                max_result_bytes=max_result_bytes,
+            ),
+            startup_timeout_sec,
+            timeout_message=(
+                "Code execution startup timed out after "
+                f"{startup_timeout_sec} seconds"
+            ),
+        )
+        if not result.ok:
+            _raise_from_worker_result(result)
 
     def call(self, args: tuple[Any, ...], timeout_sec: float) -> Any:
+        self.calls += 1
+        result = self._request(
+            _WorkerRequest(
+                kind="call",
+                call_args=args,
+                result_segment=self._result_segment_name(),
+            ),
+            timeout_sec,
+            timeout_message=(
+                f"Code execution timed out after {timeout_sec} seconds"
+            ),
+        )
+        if not result.ok:
+            _raise_from_worker_result(result)
+        return result.value
+
+    def call_many(
+        self,
+        call_args_list: list[tuple[Any, ...]],
+        per_call_timeout: float,
+        total_timeout: float,
+    ) -> list[Any]:
+        """Run a batch of calls in one round trip.
+
+        Returns each call's value, or its SafeExec* exception, in order.
+        Each call is limited to per_call_timeout; after the first call
+        that times out, the rest fail with SafeExecTimeoutError without
+        running. If the whole batch overruns total_timeout the worker is
+        killed and SafeExecTimeoutError is raised.
+        """
+        self.calls += len(call_args_list)
+        result = self._request(
+            _WorkerRequest(
+                kind="call_many",
+                call_args_list=call_args_list,
+                per_call_timeout=per_call_timeout,
+                total_timeout=total_timeout,
+                result_segment=self._result_segment_name(),
+            ),
+            total_timeout + _BATCH_DEADLINE_GRACE_SEC,
+            timeout_message=(
+                "Batched code execution timed out after "
+                f"{total_timeout} seconds"
+            ),
+        )
+        if not result.ok:
+            _raise_from_worker_result(result)
+        items: list[Any] = []
+        for item_payload in cast(list[bytes], result.value):
+            item = cast(_WorkerResult, pickle.loads(item_payload))
+            items.append(
+                item.value if item.ok else _error_from_worker_result(item)
+            )
+        return items
+
+    @staticmethod
+    def _result_segment_name() -> str | None:
+        if not _WORKER_POOL.shm_results:
+            return None
+        return f"genfxn_{os.getpid()}_{next(_RESULT_SEGMENT_IDS)}"
+
+    def _request(
+        self,
+        request: _WorkerRequest,
+        timeout_sec: float,
+        *,
+        timeout_message: str,
+    ) -> _WorkerResult:
+        segment = request.result_segment
+        try:
+            result = self._await_response(
+                request, timeout_sec, timeout_message=timeout_message
+            )
+        except BaseException:
+            # The worker is dead by now; drop a result it left behind.
+            if segment is not None:
+                _unlink_result_segment(segment)
+            raise
+        if result.segment_size is not None:
+            return _read_result_segment(cast(str, segment), result.segment_size)
+        return result
+
+    def _await_response(
+        self,
+        request: _WorkerRequest,
+        timeout_sec: float,
+        *,
+        timeout_message: str,
+    ) -> _WorkerResult:
         if not self._process.is_alive():
             exit_code = self._process.exitcode
             raise RuntimeError(
                 f"Execution worker crashed with exit code {exit_code}"
             )
 
-        self._request_queue.put(_WorkerRequest(kind="call", call_args=args))
+        self._request_queue.put(request)
+        deadline = time.monotonic() + timeout_sec
         try:
-            result: _WorkerResult = self._response_queue.get(
-                timeout=timeout_sec
-            )
-        except Empty:
-            if not self._process.is_alive():
-                exit_code = self._process.exitcode
-                self._terminate()
-                raise RuntimeError(
-                    f"Execution worker crashed with exit code {exit_code}"
-                )
+            # Poll so a crashed worker is noticed before the deadline.
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    return self._response_queue.get(
+                        timeout=min(_RESULT_QUEUE_POLL_SEC, remaining)
+                    )
+                except Empty:
+                    if not self._process.is_alive():
+                        break
+        except BaseException:
+            # An interrupted wait would leave a stale response queued for
+            # the worker's next user.
             self._terminate()
-            raise SafeExecTimeoutError(
-                f"Code execution timed out after {timeout_sec} seconds"
-            )
+            raise
 
-        if not result.ok:
-            _raise_from_worker_result(result)
-        return result.value
+        if not self._process.is_alive():
+            exit_code = self._process.exitcode
+            self._terminate()
+            raise RuntimeError(
+                f"Execution worker crashed with exit code {exit_code}"
+            )
+        self._terminate()
+        raise SafeExecTimeoutError(timeout_message)
 
     def _terminate(self) -> None:
         _terminate_process_tree(self._process)
@@ -840,6 +1414,222 @@ class _PersistentWorker:
                     )
 
 
+class _WorkerPool:
+    """Warm _PersistentWorker processes shared across isolated functions.
+
+    Workers are keyed by start method and memory limit (fixed at worker
+    startup). A released worker goes back to the pool unless it died
+    (e.g. was killed on timeout), served max_calls_per_worker calls, or
+    grew its RSS by more than max_rss_growth_mb since startup. Acquire
+    and release are thread-safe, so tasks validated on concurrent
+    threads each get their own worker.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._idle: dict[tuple[str, int | None], list[_PersistentWorker]] = {}
+        self._owner_pid = os.getpid()
+        self._atexit_registered = False
+        self.enabled = os.environ.get(_SAFE_EXEC_POOL_ENV, "1") != "0"
+        self.max_idle_workers = os.cpu_count() or 1
+        self.max_calls_per_worker = _DEFAULT_MAX_CALLS_PER_WORKER
+        self.max_rss_growth_mb: int | None = _DEFAULT_MAX_RSS_GROWTH_MB
+        self.shm_results = (
+            os.name == "posix"
+            and os.environ.get(_SAFE_EXEC_SHM_RESULTS_ENV, "1") != "0"
+        )
+
+    def _check_owner(self) -> None:
+        # Workers inherited through fork belong to the parent; forget
+        # them without closing.
+        if self._owner_pid != os.getpid():
+            self._idle = {}
+            self._owner_pid = os.getpid()
+            self._atexit_registered = False
+
+    def acquire(
+        self, *, memory_limit_mb: int | None, timeout_sec: float
+    ) -> _PersistentWorker:
+        key = (_get_mp_context().get_start_method(), memory_limit_mb)
+        stale: list[_PersistentWorker] = []
+        worker: _PersistentWorker | None = None
+        with self._lock:
+            self._check_owner()
+            idle = self._idle.get(key, [])
+            while idle:
+                candidate = idle.pop()
+                if candidate.is_alive():
+                    worker = candidate
+                    break
+                stale.append(candidate)
+        for candidate in stale:
+            candidate.close()
+        if worker is None:
+            worker = _PersistentWorker(
+                memory_limit_mb=memory_limit_mb, timeout_sec=timeout_sec
+            )
+        with self._lock:
+            if not self._atexit_registered:
+                # Registered once a worker exists, so that it runs before
+                # multiprocessing's exit handler joins live children.
+                atexit.register(self.close)
+                self._atexit_registered = True
+        return worker
+
+    def _reusable(self, worker: _PersistentWorker) -> bool:
+        if not self.enabled or not worker.is_alive():
+            return False
+        if worker.calls >= self.max_calls_per_worker:
+            return False
+        if self.max_rss_growth_mb is not None:
+            baseline = worker.baseline_rss_bytes
+            current = worker.rss_bytes()
+            if baseline is not None and current is not None:
+                growth = current - baseline
+                if growth > self.max_rss_growth_mb * 1024 * 1024:
+                    return False
+        return True
+
+    def release(self, worker: _PersistentWorker) -> None:
+        if self._reusable(worker):
+            with self._lock:
+                self._check_owner()
+                n_idle = sum(len(idle) for idle in self._idle.values())
+                if n_idle < self.max_idle_workers:
+                    self._idle.setdefault(worker.pool_key, []).append(worker)
+                    return
+        worker.close()
+
+    def prewarm(
+        self, n_workers: int, *, memory_limit_mb: int | None, timeout_sec: float
+    ) -> None:
+        workers = [
+            self.acquire(
+                memory_limit_mb=memory_limit_mb, timeout_sec=timeout_sec
+            )
+            for _ in range(n_workers)
+        ]
+        for worker in workers:
+            self.release(worker)
+
+    def close(self) -> None:
+        with self._lock:
+            self._check_owner()
+            workers = [w for idle in self._idle.values() for w in idle]
+            self._idle = {}
+        for worker in workers:
+            worker.close()
+
+
+_WORKER_POOL = _WorkerPool()
+
+
+def configure_worker_pool(
+    *,
+    enabled: bool | None = None,
+    max_idle_workers: int | None = None,
+    max_calls_per_worker: int | None = None,
+    max_rss_growth_mb: int | None = None,
+    shm_results: bool | None = None,
+) -> None:
+    """Tune the shared pool of warm sandbox workers.
+
+    Reusing a worker skips interpreter startup for every function after
+    the first, at the cost of running successive (statically validated)
+    functions in one process. Pass ``enabled=False``, or set
+    ``GENFXN_SAFE_EXEC_POOL=0``, to start a fresh worker per function.
+
+    Results over 64 KiB pickled come back through shared memory on
+    POSIX; pass ``shm_results=False``, or set
+    ``GENFXN_SAFE_EXEC_SHM_RESULTS=0``, to send everything over the pipe.
+    """
+    pool = _WORKER_POOL
+    if enabled is not None:
+        pool.enabled = enabled
+        if not enabled:
+            pool.close()
+    if max_idle_workers is not None:
+        if max_idle_workers < 0:
+            raise ValueError("max_idle_workers must be >= 0")
+        pool.max_idle_workers = max_idle_workers
+    if max_calls_per_worker is not None:
+        if max_calls_per_worker <= 0:
+            raise ValueError("max_calls_per_worker must be > 0")
+        pool.max_calls_per_worker = max_calls_per_worker
+    if max_rss_growth_mb is not None:
+        if max_rss_growth_mb <= 0:
+            raise ValueError("max_rss_growth_mb must be > 0")
+        pool.max_rss_growth_mb = max_rss_growth_mb
+    if shm_results is not None:
+        pool.shm_results = shm_results and os.name == "posix"
+
+
+def prewarm_worker_pool(
+    n_workers: int | None = None,
+    *,
+    timeout_sec: float = 1.0,
+    memory_limit_mb: int | None = 256,
+) -> None:
+    """Start idle workers ahead of use (default: one per CPU)."""
+    if n_workers is None:
+        n_workers = _WORKER_POOL.max_idle_workers
+    _WORKER_POOL.prewarm(
+        n_workers, memory_limit_mb=memory_limit_mb, timeout_sec=timeout_sec
+    )
+
+
+def shutdown_worker_pool() -> None:
+    """Stop every idle pooled worker. Workers in use close on release."""
+    _WORKER_POOL.close()
+
+
+def configure_forkserver_preload(
+    extra_modules: Sequence[str] = (), *, enabled: bool = True
+) -> None:
+    """Choose what the forkserver imports before forking sandbox workers.
+
+    This module is always preloaded when enabled; extra_modules are
+    imported after it. Takes effect only before the first worker starts.
+    """
+    preload = _FORKSERVER_PRELOAD
+    if preload.applied:
+        raise RuntimeError(
+            "Forkserver preload must be configured before the first "
+            "sandbox worker starts"
+        )
+    preload.enabled = enabled
+    preload.extra_modules = list(extra_modules)
+
+
+def configure_validation_cache(
+    *,
+    max_entries: int | None = None,
+    cache_dir: str | os.PathLike[str] | None = None,
+    persist: bool | None = None,
+) -> None:
+    """Tune the cache of static validation verdicts.
+
+    Verdicts are always kept in memory (max_entries most recent). Pass
+    cache_dir, or set ``GENFXN_SAFE_EXEC_VALIDATION_CACHE`` to a
+    directory, to also reuse them across runs; ``persist=False`` turns
+    the on-disk store off again.
+    """
+    cache = _VALIDATION_CACHE
+    if max_entries is not None:
+        if max_entries <= 0:
+            raise ValueError("max_entries must be > 0")
+        cache.max_entries = max_entries
+    if cache_dir is not None:
+        cache.cache_dir = Path(cache_dir)
+    if persist is False:
+        cache.cache_dir = None
+
+
+def clear_validation_cache() -> None:
+    """Forget in-memory verdicts. The on-disk store is left as is."""
+    _VALIDATION_CACHE.clear()
+
+
 def execute_code_restricted(
     code: str,
     allowed_builtins: dict[str, Any],
@@ -852,7 +1642,12 @@ def execute_code_restricted(
     """Execute untrusted code in a constrained subprocess and return namespace.
 
     Returned namespace contains an isolated callable at key ``f`` that also
-    executes in a separate process with the same limits.
+    executes in a separate process with the same limits. That process is
+    a warm worker from a shared pool (see configure_worker_pool); call
+    ``f.close()`` when done to hand it back.
+
+    Static validation verdicts are cached by code content (see
+    configure_validation_cache).
 
     Important: this is defense-in-depth for robustness, not a true security
     sandbox. Do not run adversarial code without OS/container isolation.
@@ -878,3 +1673,29 @@ def execute_code_restricted(
             max_result_bytes=max_result_bytes,
         )
     }
+
+
+def call_batch(
+    func: Callable[..., Any], call_args_list: Sequence[tuple[Any, ...]]
+) -> list[Any]:
+    """Call func on each args tuple; return results and exceptions in order.
+
+    Isolated functions from execute_code_restricted run the whole batch in
+    one worker round trip (each call still individually timed out); any
+    other callable is called in turn. If the batch as a whole fails (e.g.
+    the worker is killed), every item gets that exception.
+    """
+    call_many = getattr(func, "call_many", None)
+    if call_many is not None:
+        try:
+            return list(call_many(call_args_list))
+        except Exception as exc:
+            return [exc] * len(call_args_list)
+
+    outcomes: list[Any] = []
+    for args in call_args_list:
+        try:
+            outcomes.append(func(*args))
+        except Exception as exc:
+            outcomes.append(exc)
+    return outcomes
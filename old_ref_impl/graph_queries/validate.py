@@ -9,7 +9,9 @@ from genfxn.core.codegen import task_id_from_spec
 from genfxn.core.models import Task
 from genfxn.core.safe_exec import (
     SafeExecMissingFunctionError,
+    call_batch,
     execute_code_restricted,
+    parse_code,
 )
 from genfxn.core.task_ids import validate_task_ids
 from genfxn.core.validate import WRONG_FAMILY, Issue, Severity
@@ -66,7 +68,7 @@ def _validate_ast_whitelist(
     issues: list[Issue] = []
 
     try:
-        tree = ast.parse(code)
+        tree = parse_code(code)
     except (SyntaxError, TypeError):
         return [], None
 
@@ -289,7 +291,7 @@ def _validate_code_compile(
 
     if parsed_tree is None:
         try:
-            parsed_tree = ast.parse(code)
+            parsed_tree = parse_code(code)
         except (SyntaxError, TypeError) as e:
             return [
                 Issue(
@@ -506,21 +508,22 @@ def _validate_semantics(
     issues: list[Issue] = []
     severity = Severity.ERROR if strict else Severity.WARNING
 
+    cases: list[tuple[int, int, int]] = []
     for _ in range(semantic_trials):
         src = rng.randrange(spec.n_nodes)
         dst = rng.randrange(spec.n_nodes)
-        expected = eval_graph_queries(spec, src, dst)
+        cases.append((src, dst, eval_graph_queries(spec, src, dst)))
 
-        try:
-            actual = fn(src, dst)
-        except Exception as e:
+    outcomes = call_batch(fn, [(src, dst) for src, dst, _ in cases])
+    for (src, dst, expected), actual in zip(cases, outcomes, strict=True):
+        if isinstance(actual, Exception):
             issues.append(
                 Issue(
                     code=CODE_CODE_RUNTIME_ERROR,
                     severity=severity,
                     message=(
                         "Code raised runtime error for input "
-                        f"{{'src': {src}, 'dst': {dst}}}: {e}"
+                        f"{{'src': {src}, 'dst': {dst}}}: {actual}"
                     ),
                     location="code",
                     task_id=task.task_id,
@@ -9,7 +9,9 @@ from genfxn.core.codegen import task_id_from_spec
 from genfxn.core.models import Task
 from genfxn.core.safe_exec import (
     SafeExecMissingFunctionError,
+    call_batch,
     execute_code_restricted,
+    parse_code,
 )
 from genfxn.core.task_ids import validate_task_ids
 from genfxn.core.validate import WRONG_FAMILY, Issue, Severity
@@ -67,7 +69,7 @@ def _validate_ast_whitelist(
     issues: list[Issue] = []
 
     try:
-        tree = ast.parse(code)
+        tree = parse_code(code)
     except (SyntaxError, TypeError):
         return [], None
 
@@ -305,7 +307,7 @@ def _validate_code_compile(
 
     if parsed_tree is None:
         try:
-            parsed_tree = ast.parse(code)
+            parsed_tree = parse_code(code)
         except (SyntaxError, TypeError) as e:
             return [
                 Issue(
@@ -561,19 +563,21 @@ def _validate_semantics(
     issues: list[Issue] = []
     severity = Severity.ERROR if strict else Severity.WARNING
 
+    cases: list[tuple[list[tuple[int, int]], int]] = []
     for _ in range(semantic_trials):
         intervals = _sample_intervals_for_validation(rng)
-        expected = eval_intervals(spec, intervals)
+        cases.append((intervals, eval_intervals(spec, intervals)))
 
-        try:
-            actual = fn(list(intervals))
-        except Exception as e:
+    outcomes = call_batch(fn, [(list(intervals),) for intervals, _ in cases])
+    for (intervals, expected), actual in zip(cases, outcomes, strict=True):
+        if isinstance(actual, Exception):
             issues.append(
                 Issue(
                     code=CODE_CODE_RUNTIME_ERROR,
                     severity=severity,
                     message=(
-                        f"Code raised runtime error for input {intervals}: {e}"
+                        "Code raised runtime error for input "
+                        f"{intervals}: {actual}"
                     ),
                     location="code",
                     task_id=task.task_id,
@@ -9,7 +9,9 @@ from genfxn.core.models import Task
 from genfxn.core.predicates import get_threshold
 from genfxn.core.safe_exec import (
     SafeExecMissingFunctionError,
+    call_batch,
     execute_code_restricted,
+    parse_code,
 )
 from genfxn.core.task_ids import validate_task_ids
 from genfxn.core.validate import WRONG_FAMILY, Issue, Severity
@@ -63,7 +65,7 @@ def _validate_ast_whitelist(
     allowed_names = ALLOWED_CALL_NAMES | ALLOWED_VAR_NAMES | {param_name}
 
     try:
-        tree = ast.parse(code)
+        tree = parse_code(code)
     except (SyntaxError, TypeError):
         return [], None  # Let _validate_code_compile handle syntax errors
 
@@ -252,7 +254,7 @@ def _validate_code_compile(
 
     if parsed_tree is None:
         try:
-            parsed_tree = ast.parse(code)
+            parsed_tree = parse_code(code)
         except (SyntaxError, TypeError) as e:
             return [
                 Issue(
@@ -411,7 +413,8 @@ def _validate_semantics(
             )
         )
 
-    for x in sampled_points:
+    outcomes = call_batch(func, [(x,) for x in sampled_points])
+    for x, actual in zip(sampled_points, outcomes, strict=True):
         if max_issues > 0 and len(issues) >= max_issues:
             issues.append(
                 Issue(
@@ -424,14 +427,12 @@ def _validate_semantics(
             )
             break
 
-        try:
-            actual = func(x)
-        except Exception as e:
+        if isinstance(actual, Exception):
             issues.append(
                 Issue(
                     code=CODE_CODE_RUNTIME_ERROR,
                     severity=Severity.ERROR,
-                    message=f"f({x}) raised {type(e).__name__}: {e}",
+                    message=f"f({x}) raised {type(actual).__name__}: {actual}",
                     location="code",
                     task_id=task.task_id,
                 )
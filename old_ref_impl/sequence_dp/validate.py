@@ -9,7 +9,9 @@ from genfxn.core.codegen import task_id_from_spec
 from genfxn.core.models import Task
 from genfxn.core.safe_exec import (
     SafeExecMissingFunctionError,
+    call_batch,
     execute_code_restricted,
+    parse_code,
 )
 from genfxn.core.task_ids import validate_task_ids
 from genfxn.core.validate import WRONG_FAMILY, Issue, Severity
@@ -68,7 +70,7 @@ def _validate_ast_whitelist(
     issues: list[Issue] = []
 
     try:
-        tree = ast.parse(code)
+        tree = parse_code(code)
     except (SyntaxError, TypeError):
         return [], None
 
@@ -291,7 +293,7 @@ def _validate_code_compile(
 
     if parsed_tree is None:
         try:
-            parsed_tree = ast.parse(code)
+            parsed_tree = parse_code(code)
         except (SyntaxError, TypeError) as e:
             return [
                 Issue(
@@ -478,23 +480,24 @@ def _validate_semantics(
     len_b_lo, len_b_hi = _DEFAULT_LEN_B_RANGE
     val_lo, val_hi = _DEFAULT_VALUE_RANGE
 
+    cases: list[tuple[list[int], list[int], int]] = []
     for _ in range(semantic_trials):
         a_len = rng.randint(len_a_lo, len_a_hi)
         b_len = rng.randint(len_b_lo, len_b_hi)
         a = [rng.randint(val_lo, val_hi) for _ in range(a_len)]
         b = [rng.randint(val_lo, val_hi) for _ in range(b_len)]
-        expected = eval_sequence_dp(spec, a, b)
+        cases.append((a, b, eval_sequence_dp(spec, a, b)))
 
-        try:
-            actual = fn(a, b)
-        except Exception as e:
+    outcomes = call_batch(fn, [(a, b) for a, b, _ in cases])
+    for (a, b, expected), actual in zip(cases, outcomes, strict=True):
+        if isinstance(actual, Exception):
             issues.append(
                 Issue(
                     code=CODE_CODE_RUNTIME_ERROR,
                     severity=severity,
                     message=(
                         "Code raised runtime error for input "
-                        f"{{'a': {a}, 'b': {b}}}: {e}"
+                        f"{{'a': {a}, 'b': {b}}}: {actual}"
                     ),
                     location="code",
                     task_id=task.task_id,
@@ -9,7 +9,9 @@ from genfxn.core.codegen import task_id_from_spec
 from genfxn.core.models import Task
 from genfxn.core.safe_exec import (
     SafeExecMissingFunctionError,
+    call_batch,
     execute_code_restricted,
+    parse_code,
 )
 from genfxn.core.task_ids import validate_task_ids
 from genfxn.core.validate import WRONG_FAMILY, Issue, Severity
@@ -78,7 +80,7 @@ def _validate_ast_whitelist(
 
     issues: list[Issue] = []
     try:
-        tree = ast.parse(code)
+        tree = parse_code(code)
     except (SyntaxError, TypeError) as e:
         msg = e.msg if isinstance(e, SyntaxError) else str(e)
         if isinstance(e, SyntaxError) and e.lineno is not None:
@@ -308,7 +310,7 @@ def _validate_code_compile(
 
     if parsed_tree is None:
         try:
-            parsed_tree = ast.parse(code)
+            parsed_tree = parse_code(code)
         except SyntaxError as e:
             return [
                 Issue(
@@ -540,15 +542,14 @@ def _check_edge_case_handling(
     issues: list[Issue] = []
     val_lo, val_hi = _DEFAULT_VALUE_RANGE
     edge_inputs: list[list[int]] = [[], [val_lo], [val_hi]]
-    for xs in edge_inputs:
-        try:
-            actual = func(xs)
-        except Exception as e:
+    outcomes = call_batch(func, [(xs,) for xs in edge_inputs])
+    for xs, actual in zip(edge_inputs, outcomes, strict=True):
+        if isinstance(actual, Exception):
             issues.append(
                 Issue(
                     code=CODE_EDGE_CASE_FAILURE,
                     severity=Severity.ERROR,
-                    message=f"f({xs}) raised {type(e).__name__}: {e}",
+                    message=f"f({xs}) raised {type(actual).__name__}: {actual}",
                     location="code",
                     task_id=task.task_id,
                 )
@@ -612,7 +613,8 @@ def _validate_semantics(
     issues: list[Issue] = []
     test_inputs = _generate_test_inputs(axes, rng)
 
-    for xs in test_inputs:
+    outcomes = call_batch(func, [(xs,) for xs in test_inputs])
+    for xs, actual in zip(test_inputs, outcomes, strict=True):
         if max_issues > 0 and len(issues) >= max_issues:
             issues.append(
                 Issue(
@@ -625,14 +627,12 @@ def _validate_semantics(
             )
             break
 
-        try:
-            actual = func(xs)
-        except Exception as e:
+        if isinstance(actual, Exception):
             issues.append(
                 Issue(
                     code=CODE_CODE_RUNTIME_ERROR,
                     severity=Severity.ERROR,
-                    message=f"f({xs}) raised {type(e).__name__}: {e}",
+                    message=f"f({xs}) raised {type(actual).__name__}: {actual}",
                     location="code",
                     task_id=task.task_id,
                 )
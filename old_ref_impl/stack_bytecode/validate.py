@@ -9,7 +9,9 @@ from genfxn.core.codegen import task_id_from_spec
 from genfxn.core.models import Task
 from genfxn.core.safe_exec import (
     SafeExecMissingFunctionError,
+    call_batch,
     execute_code_restricted,
+    parse_code,
 )
 from genfxn.core.task_ids import validate_task_ids
 from genfxn.core.validate import WRONG_FAMILY, Issue, Severity
@@ -83,7 +85,7 @@ def _validate_ast_whitelist(
     issues: list[Issue] = []
 
     try:
-        tree = ast.parse(code)
+        tree = parse_code(code)
     except (SyntaxError, TypeError):
         return [], None
 
@@ -305,7 +307,7 @@ def _validate_code_compile(
 
     if parsed_tree is None:
         try:
-            parsed_tree = ast.parse(code)
+            parsed_tree = parse_code(code)
         except (SyntaxError, TypeError) as e:
             return [
                 Issue(
@@ -486,19 +488,22 @@ def _validate_semantics(
     len_lo, len_hi = axes.list_length_range
     val_lo, val_hi = _DEFAULT_VALUE_RANGE
 
+    cases: list[tuple[list[int], tuple[int, int]]] = []
     for _ in range(semantic_trials):
         n = rng.randint(len_lo, len_hi)
         xs = [rng.randint(val_lo, val_hi) for _ in range(n)]
-        expected = eval_stack_bytecode(spec, xs)
+        cases.append((xs, eval_stack_bytecode(spec, xs)))
 
-        try:
-            actual = fn(xs)
-        except Exception as e:
+    outcomes = call_batch(fn, [(xs,) for xs, _ in cases])
+    for (xs, expected), actual in zip(cases, outcomes, strict=True):
+        if isinstance(actual, Exception):
             issues.append(
                 Issue(
                     code=CODE_CODE_RUNTIME_ERROR,
                     severity=severity,
-                    message=f"Code raised runtime error for input {xs}: {e}",
+                    message=(
+                        f"Code raised runtime error for input {xs}: {actual}"
+                    ),
                     location="code",
                     task_id=task.task_id,
                 )
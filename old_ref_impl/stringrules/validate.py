@@ -9,7 +9,9 @@ from genfxn.core.codegen import task_id_from_spec
 from genfxn.core.models import Task
 from genfxn.core.safe_exec import (
     SafeExecMissingFunctionError,
+    call_batch,
     execute_code_restricted,
+    parse_code,
 )
 from genfxn.core.string_predicates import eval_string_predicate
 from genfxn.core.task_ids import validate_task_ids
@@ -89,7 +91,7 @@ def _validate_ast_whitelist(
     allowed_names = ALLOWED_CALL_NAMES | ALLOWED_VAR_NAMES | {param_name}
 
     try:
-        tree = ast.parse(code)
+        tree = parse_code(code)
     except (SyntaxError, TypeError):
         return [], None
 
@@ -330,7 +332,7 @@ def _validate_code_compile(
 
     if parsed_tree is None:
         try:
-            parsed_tree = ast.parse(code)
+            parsed_tree = parse_code(code)
         except (SyntaxError, TypeError) as e:
             return [
                 Issue(
@@ -510,7 +512,8 @@ def _validate_semantics(
             )
         ]
 
-    for s in test_inputs:
+    outcomes = call_batch(func, [(s,) for s in test_inputs])
+    for s, actual in zip(test_inputs, outcomes, strict=True):
         if max_issues > 0 and len(issues) >= max_issues:
             issues.append(
                 Issue(
@@ -523,14 +526,14 @@ def _validate_semantics(
             )
             break
 
-        try:
-            actual = func(s)
-        except Exception as e:
+        if isinstance(actual, Exception):
             issues.append(
                 Issue(
                     code=CODE_CODE_RUNTIME_ERROR,
                     severity=Severity.ERROR,
-                    message=f"f({s!r}) raised {type(e).__name__}: {e}",
+                    message=(
+                        f"f({s!r}) raised {type(actual).__name__}: {actual}"
+                    ),
                     location="code",
                     task_id=task.task_id,
                 )
@@ -9,7 +9,9 @@ from genfxn.core.codegen import task_id_from_spec
 from genfxn.core.models import Task
 from genfxn.core.safe_exec import (
     SafeExecMissingFunctionError,
+    call_batch,
     execute_code_restricted,
+    parse_code,
 )
 from genfxn.core.task_ids import validate_task_ids
 from genfxn.core.validate import WRONG_FAMILY, Issue, Severity
@@ -70,7 +72,7 @@ def _validate_ast_whitelist(
     issues: list[Issue] = []
 
     try:
-        tree = ast.parse(code)
+        tree = parse_code(code)
     except (SyntaxError, TypeError):
         return [], None
 
@@ -308,7 +310,7 @@ def _validate_code_compile(
 
     if parsed_tree is None:
         try:
-            parsed_tree = ast.parse(code)
+            parsed_tree = parse_code(code)
         except (SyntaxError, TypeError) as exc:
             return [
                 Issue(
@@ -473,22 +475,25 @@ def _validate_semantics(
     issues: list[Issue] = []
     severity = Severity.ERROR if strict else Severity.WARNING
 
+    cases: list[tuple[list[int], int]] = []
     for _ in range(semantic_trials):
         xs = sample_sequence(
             length_range=_DEFAULT_SEQUENCE_LENGTH_RANGE,
             value_range=_DEFAULT_VALUE_RANGE,
             rng=rng,
         )
-        expected = eval_temporal_logic(spec, xs)
+        cases.append((xs, eval_temporal_logic(spec, xs)))
 
-        try:
-            actual = fn(xs)
-        except Exception as exc:
+    outcomes = call_batch(fn, [(xs,) for xs, _ in cases])
+    for (xs, expected), actual in zip(cases, outcomes, strict=True):
+        if isinstance(actual, Exception):
             issues.append(
                 Issue(
                     code=CODE_CODE_RUNTIME_ERROR,
                     severity=severity,
-                    message=f"Code raised runtime error for input {xs}: {exc}",
+                    message=(
+                        f"Code raised runtime error for input {xs}: {actual}"
+                    ),
                     location="code",
                     task_id=task.task_id,
                 )
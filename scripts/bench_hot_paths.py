@@ -0,0 +1,249 @@
+"""Microbenchmarks for genfxn.ops and genfxn.spaces hot paths.
+
+Times (or, with --mode alloc, traces allocations for) each case, writes
+the results as JSON, and compares against a stored baseline written by
+an earlier run. Any metric that grows by more than the threshold
+fraction over the baseline is reported and fails the run.
+
+Baselines for both modes are committed next to this script and are used
+unless --baseline points elsewhere. Timings depend on the machine, so
+refresh bench_hot_paths_time.json with -o when measuring on new hardware.
+
+Alloc mode uses tracemalloc and records, per case, the peak traced bytes
+of a single call and the blocks still allocated per call after many
+calls; pydantic model constructions on a hot path show up in both.
+
+Usage:
+    uv run python scripts/bench_hot_paths.py
+    uv run python scripts/bench_hot_paths.py --mode alloc
+    uv run python scripts/bench_hot_paths.py --baseline bench.json
+    uv run python scripts/bench_hot_paths.py --no-compare -o bench.json
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import random
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Annotated, Any
+
+import typer
+
+from genfxn.ops.mixture_op import MixtureOp
+from genfxn.ops.registry import build_op
+from genfxn.ops.string_ops.registry import STRING_OP_REGISTRY
+from genfxn.spaces.simple_string_input_space import SimpleStringInputSpace
+from genfxn.spaces.string_space import StringSpace
+from genfxn.types import DEFAULT_STR_INPUT_VAR
+
+app = typer.Typer(add_completion=False)
+
+EVAL_INPUT = " Hello\tWorld, genfxn! "
+VALIDATE_LENGTHS = (10, 1_000, 10_000)
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+DEFAULT_BASELINES = {
+    "time": SCRIPT_DIR / "bench_hot_paths_time.json",
+    "alloc": SCRIPT_DIR / "bench_hot_paths_alloc.json",
+}
+
+# Absolute slack per metric, so noise on near-zero values never fails.
+ABS_SLACK = {
+    "usec_per_call": 0.5,
+    "peak_bytes": 256.0,
+    "retained_blocks_per_call": 0.5,
+}
+
+
+@dataclass(frozen=True)
+class BenchCase:
+    name: str
+    fn: Callable[[], object]
+    number: int
+
+
+def build_cases() -> list[BenchCase]:
+    cases: list[BenchCase] = []
+    kwargs = {DEFAULT_STR_INPUT_VAR: EVAL_INPUT}
+
+    for op_type in STRING_OP_REGISTRY:
+        op = build_op(op_type)
+        cases.append(
+            BenchCase(
+                f"eval/{op_type}",
+                lambda op=op: op.eval(**kwargs),
+                number=2_000,
+            )
+        )
+
+    mixture = MixtureOp(
+        choices=("lower_str", "upper_str", "tab_str"),
+        weights=(1.0, 1.0, 1.0),
+        input_space=StringSpace(),
+        rng=random.Random(0),
+    )
+    cases.append(
+        BenchCase("mixture/eval", lambda: mixture.eval(**kwargs), 2_000)
+    )
+    cases.append(
+        BenchCase("mixture/render_python", mixture.render_python, 2_000)
+    )
+
+    space = StringSpace()
+    for length in VALIDATE_LENGTHS:
+        value = ("abc\tXYZ " * (length // 8 + 1))[:length]
+        cases.append(
+            BenchCase(
+                f"validate_member/{length}",
+                lambda value=value: space.validate_member(
+                    **{DEFAULT_STR_INPUT_VAR: value}
+                ),
+                number=max(10, 200_000 // length),
+            )
+        )
+
+    input_space = SimpleStringInputSpace()
+    sample_rng = random.Random(0)
+    cases.append(
+        BenchCase(
+            "simple_string_input_space/sample_10",
+            lambda: input_space.sample(10, sample_rng),
+            number=20,
+        )
+    )
+
+    cases.append(
+        BenchCase("build_op/lower_str", lambda: build_op("lower_str"), 200)
+    )
+    return cases
+
+
+def time_case(case: BenchCase, repeat: int) -> dict[str, float]:
+    case.fn()  # Warm up lazily compiled state.
+    timings = timeit.Timer(case.fn).repeat(repeat=repeat, number=case.number)
+    return {"usec_per_call": min(timings) / case.number * 1e6}
+
+
+def alloc_case(case: BenchCase) -> dict[str, float]:
+    case.fn()  # Warm up lazily compiled state.
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base_size, _ = tracemalloc.get_traced_memory()
+        case.fn()
+        _, peak = tracemalloc.get_traced_memory()
+
+        before = tracemalloc.take_snapshot()
+        for _ in range(case.number):
+            case.fn()
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    retained = sum(
+        stat.count_diff for stat in after.compare_to(before, "lineno")
+    )
+    return {
+        "peak_bytes": float(peak - base_size),
+        "retained_blocks_per_call": retained / case.number,
+    }
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    regressions: list[str] = []
+    for name, metrics in results.items():
+        for metric, value in metrics.items():
+            old = baseline.get(name, {}).get(metric)
+            if old is None:
+                continue
+            limit = old * (1 + threshold) + ABS_SLACK.get(metric, 0.0)
+            if value > limit:
+                regressions.append(
+                    f"{name} {metric}: {old:.2f} -> {value:.2f} "
+                    f"(limit {limit:.2f})"
+                )
+    return regressions
+
+
+@app.command()
+def main(
+    mode: Annotated[str, typer.Option("--mode", help="time or alloc")] = "time",
+    output: Annotated[
+        Path | None,
+        typer.Option("--output", "-o", help="Write results JSON here"),
+    ] = None,
+    baseline: Annotated[
+        Path | None,
+        typer.Option(
+            "--baseline",
+            help="Results JSON to compare against [default: the committed "
+            "baseline for --mode]",
+        ),
+    ] = None,
+    compare: Annotated[
+        bool,
+        typer.Option(
+            "--compare/--no-compare", help="Compare against a baseline"
+        ),
+    ] = True,
+    threshold: Annotated[
+        float,
+        typer.Option(help="Allowed fractional regression vs baseline"),
+    ] = 0.25,
+    filter: Annotated[
+        str | None,
+        typer.Option(help="Only run cases whose name contains this"),
+    ] = None,
+    repeat: Annotated[
+        int, typer.Option(help="Timing repeats (best is kept)")
+    ] = 5,
+) -> None:
+    if mode not in ("time", "alloc"):
+        raise typer.BadParameter("mode must be 'time' or 'alloc'")
+
+    results: dict[str, dict[str, float]] = {}
+    for case in build_cases():
+        if filter is not None and filter not in case.name:
+            continue
+        metrics = (
+            time_case(case, repeat) if mode == "time" else alloc_case(case)
+        )
+        results[case.name] = metrics
+        shown = ", ".join(f"{k}={v:.2f}" for k, v in metrics.items())
+        typer.echo(f"{case.name:<40} {shown}")
+
+    report: dict[str, Any] = {
+        "mode": mode,
+        "python": platform.python_version(),
+        "results": results,
+    }
+    if output is not None:
+        output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if compare:
+        if baseline is None:
+            baseline = DEFAULT_BASELINES[mode]
+        stored = json.loads(baseline.read_text())
+        if stored.get("mode") != mode:
+            raise typer.BadParameter(
+                f"baseline mode {stored.get('mode')!r} != {mode!r}"
+            )
+        regressions = find_regressions(results, stored["results"], threshold)
+        for line in regressions:
+            typer.echo(f"REGRESSION {line}", err=True)
+        if regressions:
+            raise typer.Exit(code=1)
+        typer.echo(f"No regressions beyond {threshold:.0%} vs {baseline}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,112 @@
+"""Compare per-eval op constructions with and without the op intern cache.
+
+The "uncached" rows replay the old behavior of building a fresh leaf op
+on every mixture eval / compound construction; the "cached" rows use the
+current code paths backed by genfxn.ops.registry.get_op. For each row
+we report op model constructions per call and the tracemalloc peak.
+
+Usage:
+    uv run python scripts/bench_op_allocations.py
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from genfxn.ops.base_op import BaseOp
+from genfxn.ops.mixture_op import MixtureOp
+from genfxn.ops.registry import build_op, clear_op_cache, op_cache_info
+from genfxn.ops.simple_str_compound_op import SimpleStrCompoundOp
+from genfxn.spaces.string_space import StringSpace
+from genfxn.types import DEFAULT_STR_INPUT_VAR
+
+N_CALLS = 2_000
+
+
+def _measure(
+    fn: Callable[[], object], n_calls: int
+) -> tuple[float, int, float]:
+    """Return (op constructions/call, peak traced bytes, usec/call)."""
+    constructed = 0
+    original_post_init = BaseOp.model_post_init
+
+    def counting_post_init(self: BaseOp, context: Any) -> None:
+        nonlocal constructed
+        constructed += 1
+        original_post_init(self, context)
+
+    fn()  # Warm up lazily compiled indexes and caches.
+    BaseOp.model_post_init = counting_post_init  # type: ignore[method-assign]
+    try:
+        for _ in range(n_calls):
+            fn()
+    finally:
+        BaseOp.model_post_init = original_post_init
+
+    tracemalloc.start()
+    try:
+        fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        fn()
+    elapsed = time.perf_counter() - start
+    return constructed / n_calls, peak, elapsed / n_calls * 1e6
+
+
+def main() -> None:
+    rng = random.Random(0)
+    space = StringSpace()
+    kwargs = {DEFAULT_STR_INPUT_VAR: "Hello\tWorld"}
+
+    mixture = MixtureOp(
+        choices=("lower_str", "upper_str", "tab_str"),
+        weights=(1.0, 1.0, 1.0),
+        input_space=space,
+        rng=rng,
+    )
+
+    def mixture_uncached() -> object:
+        mixture.validate_input(**kwargs)
+        idx = mixture.sample_choice_indices(1, rng)[0]
+        op = build_op(mixture.choices[idx], input_space=space)
+        op.validate_input(**kwargs)
+        return op.eval(**kwargs)
+
+    def mixture_cached() -> object:
+        return mixture.eval(**kwargs)
+
+    def compound_uncached() -> object:
+        clear_op_cache()
+        return SimpleStrCompoundOp(transform="swapcase_str").eval(**kwargs)
+
+    def compound_cached() -> object:
+        return SimpleStrCompoundOp(transform="swapcase_str").eval(**kwargs)
+
+    rows = [
+        ("mixture eval", mixture_uncached, mixture_cached),
+        ("compound build+eval", compound_uncached, compound_cached),
+    ]
+    print(
+        f"{'case':<22}{'mode':<10}{'ops/call':>10}"
+        f"{'peak KiB':>10}{'usec/call':>11}"
+    )
+    for name, uncached, cached in rows:
+        for mode, fn in (("uncached", uncached), ("cached", cached)):
+            ops_per_call, peak, usec = _measure(fn, N_CALLS)
+            print(
+                f"{name:<22}{mode:<10}{ops_per_call:>10.2f}"
+                f"{peak / 1024:>10.1f}{usec:>11.1f}"
+            )
+    print(op_cache_info())
+
+
+if __name__ == "__main__":
+    main()
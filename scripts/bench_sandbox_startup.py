@@ -0,0 +1,124 @@
+"""Benchmark sandbox worker startup for execute_code_restricted.
+
+Each mode runs in a fresh interpreter, since the start method and the
+forkserver's preload are fixed once the first worker starts:
+
+- spawn: every worker starts a new interpreter.
+- forkserver-bare: workers fork from a forkserver that preloads nothing.
+- forkserver-warm: workers fork from a forkserver that already imported
+  the sandbox module (the default).
+
+Reported per mode, as medians in milliseconds:
+
+- first: the first function, including forkserver startup.
+- fresh: a function on a newly started worker (pool disabled).
+- pooled: a function on a warm pooled worker.
+
+Children run via ``python -c`` so the forkserver's default __main__
+preload cannot warm the bare mode by importing this script.
+
+Usage:
+    uv run python scripts/bench_sandbox_startup.py
+    uv run python scripts/bench_sandbox_startup.py --n-functions 20 -o s.json
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Annotated
+
+import typer
+
+app = typer.Typer(add_completion=False)
+
+MODES: dict[str, dict[str, str]] = {
+    "spawn": {"GENFXN_SAFE_EXEC_START_METHOD": "spawn"},
+    "forkserver-bare": {
+        "GENFXN_SAFE_EXEC_START_METHOD": "forkserver",
+        "GENFXN_SAFE_EXEC_PRELOAD": "0",
+    },
+    "forkserver-warm": {"GENFXN_SAFE_EXEC_START_METHOD": "forkserver"},
+}
+
+CODE = "def f(x):\n    return x + 1\n"
+
+
+def run_child(n_functions: int) -> None:
+    """Time sandbox functions in this process; print the JSON result."""
+    from old_ref_impl.core.safe_exec import (
+        configure_worker_pool,
+        execute_code_restricted,
+    )
+
+    def time_function() -> float:
+        start = time.perf_counter()
+        f = execute_code_restricted(
+            CODE, {}, memory_limit_mb=None, trust_untrusted_code=True
+        )["f"]
+        f(1)
+        f.close()
+        return (time.perf_counter() - start) * 1e3
+
+    first = time_function()
+    configure_worker_pool(enabled=False)
+    fresh = [time_function() for _ in range(n_functions)]
+    configure_worker_pool(enabled=True)
+    time_function()  # Leave one warm worker in the pool.
+    pooled = [time_function() for _ in range(n_functions)]
+    print(
+        json.dumps(
+            {
+                "first": first,
+                "fresh": statistics.median(fresh),
+                "pooled": statistics.median(pooled),
+            }
+        )
+    )
+
+
+def run_mode(mode: str, n_functions: int) -> dict[str, float]:
+    script_dir = Path(__file__).resolve().parent
+    paths = [str(script_dir), str(script_dir.parent)]
+    child = (
+        f"import sys; sys.path[:0] = {paths!r}; "
+        "from bench_sandbox_startup import run_child; "
+        f"run_child({n_functions})"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", child],
+        env={**os.environ, **MODES[mode]},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+@app.command()
+def main(
+    n_functions: Annotated[
+        int, typer.Option(help="Functions timed per measurement")
+    ] = 10,
+    output: Annotated[
+        Path | None, typer.Option("--output", "-o", help="JSON output path")
+    ] = None,
+) -> None:
+    results = {mode: run_mode(mode, n_functions) for mode in MODES}
+    typer.echo(f"{'mode':<18}{'first':>10}{'fresh':>10}{'pooled':>10}")
+    for mode, timings in results.items():
+        typer.echo(
+            f"{mode:<18}{timings['first']:>10.1f}"
+            f"{timings['fresh']:>10.1f}{timings['pooled']:>10.1f}"
+        )
+    if output is not None:
+        output.write_text(json.dumps(results, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    app()
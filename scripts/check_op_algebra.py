@@ -0,0 +1,125 @@
+"""Check declared op algebra laws and canonical chains against eval.
+
+Every law declared in an op's ``algebra`` (ASCII laws included) is
+tested on random ASCII strings, then every chain of string ops up to
+--max-len steps is checked to evaluate the same as its canonical_steps
+reduction. Run this after adding or changing a law.
+
+Usage:
+    uv run python scripts/check_op_algebra.py
+    uv run python scripts/check_op_algebra.py --max-len 4
+"""
+
+from __future__ import annotations
+
+import itertools
+import random
+from collections.abc import Sequence
+from typing import Annotated
+
+import typer
+
+from genfxn.ops.algebra import canonical_steps
+from genfxn.ops.registry import get_op, get_op_cls
+from genfxn.ops.string_ops.registry import list_string_op_types
+
+app = typer.Typer(add_completion=False)
+
+# Whitespace, case and tab edge cases are what the laws depend on.
+ALPHABET = "aAbZz 1\t\n'-_.x\x0b\x1c"
+
+
+def sample_inputs(n_samples: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    inputs = [""]
+    for _ in range(n_samples):
+        length = rng.randint(0, 12)
+        if rng.random() < 0.5:
+            inputs.append("".join(rng.choices(ALPHABET, k=length)))
+        else:
+            inputs.append(
+                "".join(chr(rng.randrange(128)) for _ in range(length))
+            )
+    return inputs
+
+
+def run_chain(steps: Sequence[str], inputs: list[str]) -> list[str]:
+    values = inputs
+    for step in steps:
+        values = get_op(step).eval_many(values, validate=False)
+    return values
+
+
+def law_failures(inputs: list[str]) -> list[str]:
+    failures: list[str] = []
+
+    def check(name: str, lhs: Sequence[str], rhs: Sequence[str]) -> None:
+        if run_chain(lhs, inputs) != run_chain(rhs, inputs):
+            failures.append(name)
+
+    for op_type in list_string_op_types():
+        law = get_op_cls(op_type).algebra.for_domain(ascii=True)
+        if law.idempotent:
+            check(f"{op_type} idempotent", [op_type] * 2, [op_type])
+        if law.involution:
+            check(f"{op_type} involution", [op_type] * 2, [])
+        if law.equivalent_to is not None:
+            check(
+                f"{op_type} == {law.equivalent_to}",
+                [op_type],
+                [law.equivalent_to],
+            )
+        for other in law.absorbs_preceding:
+            check(
+                f"{op_type} absorbs preceding {other}",
+                [other, op_type],
+                [op_type],
+            )
+        for other in law.absorbs_following:
+            check(
+                f"{op_type} absorbs following {other}",
+                [op_type, other],
+                [op_type],
+            )
+        for other in law.commutes_with:
+            check(
+                f"{op_type} commutes with {other}",
+                [other, op_type],
+                [op_type, other],
+            )
+        for other, fused in law.fuses_after.items():
+            check(
+                f"{op_type} after {other} == {fused}", [other, op_type], [fused]
+            )
+    return failures
+
+
+@app.command()
+def main(
+    max_len: Annotated[int, typer.Option(help="Longest chain to check")] = 3,
+    n_samples: Annotated[int, typer.Option(help="Random inputs")] = 500,
+    seed: Annotated[int, typer.Option()] = 0,
+) -> None:
+    inputs = sample_inputs(n_samples, seed)
+    failures = law_failures(inputs)
+
+    op_types = list_string_op_types()
+    n_chains = 0
+    canonical: set[tuple[str, ...]] = set()
+    for length in range(1, max_len + 1):
+        for steps in itertools.product(op_types, repeat=length):
+            n_chains += 1
+            reduced = canonical_steps(steps, ascii=True)
+            canonical.add(reduced)
+            if run_chain(steps, inputs) != run_chain(reduced, inputs):
+                failures.append(f"{' -> '.join(steps)} != {reduced}")
+
+    typer.echo(f"{n_chains} chains, {len(canonical)} canonical forms")
+    for failure in failures:
+        typer.echo(f"FAIL {failure}", err=True)
+    if failures:
+        raise typer.Exit(code=1)
+
+
+if __name__ == "__main__":
+    app()
@@ -95,6 +95,11 @@ def _registry_dicts(tree: ast.Module) -> list[tuple[str, list[str]]]:
                 values.append(v.id)
             elif isinstance(v, ast.Starred) and isinstance(v.value, ast.Name):
                 values.append(v.value.id)
+            elif isinstance(v, ast.JoinedStr | ast.Constant):
+                # Lazy "module:Class" targets; the class follows the colon.
+                text = ast.unparse(v)
+                if ":" in text:
+                    values.append(text.rsplit(":", 1)[1].strip("'\""))
         results.append((name, values))
     return results
 
@@ -0,0 +1,288 @@
+"""Memory-mapped binary storage for (op config, input, output) rows.
+
+File layout (little-endian; offset/id arrays use native order, which is
+little-endian on every supported platform)::
+
+    magic                      8 bytes
+    data blob                  input/output UTF-8 bytes, row by row
+    padding                    to an 8-byte boundary
+    offsets                    int64[2 * n_rows + 1] into the data blob
+    config ids                 uint32[n_rows]
+    padding                    to an 8-byte boundary
+    configs                    JSON list of distinct op config strings
+    footer                     offsets_pos, ids_pos, configs_pos, n_rows
+                               (4 x uint64) then magic
+
+Row i's input is ``blob[offsets[2i]:offsets[2i + 1]]`` and its output is
+``blob[offsets[2i + 1]:offsets[2i + 2]]``. Rows stream to disk as they
+are written; the offset table and configs follow once at close. Readers
+mmap the file and touch only the rows they access.
+"""
+
+from __future__ import annotations
+
+import codecs
+import json
+import mmap
+import os
+import random
+import struct
+from array import array
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO
+
+from genfxn.ops.base_op import BaseOp
+from genfxn.spaces.space import DEFAULT_SAMPLE_CHUNK_SIZE, Space
+
+MAGIC = b"GFXBIN01"
+_FOOTER = struct.Struct("<4Q")
+_HEADER_SIZE = len(MAGIC)
+_TRAILER_SIZE = _FOOTER.size + len(MAGIC)
+
+
+def _pad_to_8(handle: BinaryIO) -> None:
+    handle.write(b"\0" * (-handle.tell() % 8))
+
+
+class BinaryDatasetWriter:
+    """Stream (op config, input, output) rows into a binary dataset.
+
+    Op configs are the op's JSON dump and are stored once per distinct
+    config; rows reference them by id. Rows go to ``<path>.tmp``, which
+    replaces path only once close() has written the footer; abort(), or
+    an exception inside a with block, deletes it instead.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self._path = Path(path)
+        self._tmp_path = self._path.with_name(f"{self._path.name}.tmp")
+        self._handle: BinaryIO = open(self._tmp_path, "wb")
+        self._handle.write(MAGIC)
+        self._offsets = array("q", [0])
+        self._config_ids = array("I")
+        self._config_index: dict[str, int] = {}
+        self._blob_size = 0
+        self._closed = False
+
+    def __enter__(self) -> BinaryDatasetWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def _config_id(self, config: str) -> int:
+        config_id = self._config_index.get(config)
+        if config_id is None:
+            config_id = len(self._config_index)
+            self._config_index[config] = config_id
+        return config_id
+
+    def write_rows(
+        self,
+        config: str | BaseOp,
+        inputs: Sequence[str],
+        outputs: Sequence[str],
+    ) -> None:
+        """Append one row per (input, output) pair sharing a config."""
+        if self._closed:
+            raise ValueError("writer is closed")
+        if len(inputs) != len(outputs):
+            raise ValueError("inputs and outputs must have the same length")
+        if isinstance(config, BaseOp):
+            config = config.model_dump_json()
+
+        config_id = self._config_id(config)
+        chunks: list[bytes] = []
+        for input, output in zip(inputs, outputs, strict=True):
+            for value in (input, output):
+                encoded = value.encode("utf-8")
+                chunks.append(encoded)
+                self._blob_size += len(encoded)
+                self._offsets.append(self._blob_size)
+        self._handle.write(b"".join(chunks))
+        self._config_ids.extend([config_id] * len(inputs))
+
+    def write_from_sampler(
+        self,
+        op: BaseOp,
+        space: Space,
+        n_samples: int,
+        rng: random.Random,
+        chunk_size: int = DEFAULT_SAMPLE_CHUNK_SIZE,
+    ) -> None:
+        """Sample inputs from space and write op's outputs, chunk by chunk.
+
+        Memory stays bounded by chunk_size. Inputs drawn from op's own
+        input_space skip re-validation.
+        """
+        validate = space is not op.input_space
+        chunk: list[str] = []
+        for value in space.iter_samples(n_samples, rng, chunk_size):
+            chunk.append(value)
+            if len(chunk) == chunk_size:
+                self.write_rows(
+                    op, chunk, op.eval_many(chunk, validate=validate)
+                )
+                chunk = []
+        if chunk:
+            self.write_rows(op, chunk, op.eval_many(chunk, validate=validate))
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        handle = self._handle
+        try:
+            _pad_to_8(handle)
+            offsets_pos = handle.tell()
+            self._offsets.tofile(handle)
+            ids_pos = handle.tell()
+            self._config_ids.tofile(handle)
+            _pad_to_8(handle)
+            configs_pos = handle.tell()
+            configs = list(self._config_index)
+            handle.write(json.dumps(configs).encode("utf-8"))
+            handle.write(
+                _FOOTER.pack(
+                    offsets_pos, ids_pos, configs_pos, len(self._config_ids)
+                )
+            )
+            handle.write(MAGIC)
+            handle.close()
+            os.replace(self._tmp_path, self._path)
+        except BaseException:
+            handle.close()
+            self._tmp_path.unlink(missing_ok=True)
+            raise
+
+    def abort(self) -> None:
+        """Discard the rows written so far, leaving path untouched."""
+        if self._closed:
+            return
+        self._closed = True
+        self._handle.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+
+class BinaryDataset(Sequence[tuple[str, str, str]]):
+    """Random-access, memory-mapped reader for a binary dataset.
+
+    Opening maps the file and parses only the footer and config list;
+    rows are located through the mapped offset table on access.
+    Indexing decodes a (config, input, output) row; row_views returns
+    zero-copy memoryviews instead. Release any views before close().
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        with open(path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._init_views()
+        except Exception:
+            self._mmap.close()
+            raise
+
+    def _init_views(self) -> None:
+        buf = memoryview(self._mmap)
+        views = [buf]
+        try:
+            size = len(buf)
+            if (
+                size < _HEADER_SIZE + _TRAILER_SIZE
+                or buf[:_HEADER_SIZE] != MAGIC
+                or buf[size - len(MAGIC) :] != MAGIC
+            ):
+                raise ValueError("not a genfxn binary dataset")
+
+            footer_pos = size - _TRAILER_SIZE
+            offsets_pos, ids_pos, configs_pos, n_rows = _FOOTER.unpack_from(
+                buf, footer_pos
+            )
+            if (
+                not _HEADER_SIZE <= offsets_pos <= ids_pos <= configs_pos
+                or configs_pos > footer_pos
+                or ids_pos - offsets_pos != 8 * (2 * n_rows + 1)
+                or configs_pos - ids_pos < 4 * n_rows
+            ):
+                raise ValueError("corrupt binary dataset layout")
+
+            blob = buf[_HEADER_SIZE:offsets_pos]
+            views.append(blob)
+            offsets = buf[offsets_pos:ids_pos].cast("q")
+            views.append(offsets)
+            config_ids = buf[ids_pos : ids_pos + 4 * n_rows].cast("I")
+            views.append(config_ids)
+            configs = tuple(json.loads(bytes(buf[configs_pos:footer_pos])))
+        except BaseException:
+            # The mmap cannot close while any view over it is alive.
+            for view in reversed(views):
+                view.release()
+            raise
+
+        self._n_rows = n_rows
+        self._buf = buf
+        self._blob = blob
+        self._offsets = offsets
+        self._config_ids = config_ids
+        self.configs: tuple[str, ...] = configs
+
+    def __enter__(self) -> BinaryDataset:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for view in (self._offsets, self._config_ids, self._blob, self._buf):
+            view.release()
+        self._mmap.close()
+
+    def __len__(self) -> int:
+        return self._n_rows
+
+    def _row_index(self, index: int) -> int:
+        if index < 0:
+            index += self._n_rows
+        if not 0 <= index < self._n_rows:
+            raise IndexError("BinaryDataset index out of range")
+        return index
+
+    def row_views(self, index: int) -> tuple[int, memoryview, memoryview]:
+        """Return (config id, input bytes, output bytes) without copying."""
+        index = self._row_index(index)
+        offsets = self._offsets
+        start, mid, end = offsets[2 * index : 2 * index + 3]
+        return (
+            self._config_ids[index],
+            self._blob[start:mid],
+            self._blob[mid:end],
+        )
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._n_rows))]
+        config_id, input, output = self.row_views(index)
+        return (
+            self.configs[config_id],
+            codecs.decode(input, "utf-8"),
+            codecs.decode(output, "utf-8"),
+        )
+
+    def iter_row_views(self) -> Iterator[tuple[int, memoryview, memoryview]]:
+        for index in range(self._n_rows):
+            yield self.row_views(index)
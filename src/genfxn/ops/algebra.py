@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any
+
+from genfxn.ops.registry import get_op_cls
+
+CANONICAL_CACHE_MAXSIZE = 4096
+
+
+@dataclass(frozen=True)
+class OpAlgebra:
+    """Algebraic laws of a str -> str op f, declared per op class.
+
+    Relations name other ops by op_type; "after g" means applied to
+    g's output. Laws in ``on_ascii`` hold only when every char is ASCII
+    (e.g. "ß".upper() is "SS").
+    """
+
+    # f(f(s)) == f(s)
+    idempotent: bool = False
+    # f(f(s)) == s
+    involution: bool = False
+    # f == the named op_type
+    equivalent_to: str | None = None
+    # f(g(s)) == f(s) for g in absorbs_preceding
+    absorbs_preceding: frozenset[str] = frozenset()
+    # h(f(s)) == f(s) for h in absorbs_following
+    absorbs_following: frozenset[str] = frozenset()
+    # f(g(s)) == g(f(s)); symmetric, declaring it on either op suffices
+    commutes_with: frozenset[str] = frozenset()
+    # f(g(s)) == fuses_after[g](s)
+    fuses_after: Mapping[str, str] = field(default_factory=dict)
+    on_ascii: OpAlgebra | None = None
+
+    def for_domain(self, ascii: bool) -> OpAlgebra:
+        """Return the laws that hold on an (ASCII or general) domain."""
+        extra = self.on_ascii
+        if not ascii or extra is None:
+            return self
+        return OpAlgebra(
+            idempotent=self.idempotent or extra.idempotent,
+            involution=self.involution or extra.involution,
+            equivalent_to=extra.equivalent_to or self.equivalent_to,
+            absorbs_preceding=self.absorbs_preceding | extra.absorbs_preceding,
+            absorbs_following=self.absorbs_following | extra.absorbs_following,
+            commutes_with=self.commutes_with | extra.commutes_with,
+            fuses_after={**self.fuses_after, **extra.fuses_after},
+        )
+
+
+def is_ascii_domain(space: Any) -> bool:
+    """Whether every char of a string space (or char space) is ASCII."""
+    char_space = getattr(space, "char_space", space)
+    values = getattr(char_space, "values", None)
+    if values is None:
+        return False
+    return all(isinstance(value, str) and value.isascii() for value in values)
+
+
+@lru_cache(maxsize=256)
+def _algebra(op_type: str, ascii: bool) -> OpAlgebra:
+    return get_op_cls(op_type).algebra.for_domain(ascii)
+
+
+def _rewrite_pair(first: str, second: str, ascii: bool) -> list[str] | None:
+    """Rewrite (first, then second) to fewer steps, or return None."""
+    f, g = _algebra(second, ascii), _algebra(first, ascii)
+    if first == second:
+        if f.involution:
+            return []
+        if f.idempotent:
+            return [first]
+    if first in f.absorbs_preceding:
+        return [second]
+    if second in g.absorbs_following:
+        return [first]
+    fused = f.fuses_after.get(first)
+    if fused is not None:
+        return [fused]
+    return None
+
+
+def _commute(first: str, second: str, ascii: bool) -> bool:
+    return (
+        second in _algebra(first, ascii).commutes_with
+        or first in _algebra(second, ascii).commutes_with
+    )
+
+
+@lru_cache(maxsize=CANONICAL_CACHE_MAXSIZE)
+def _canonical_steps(steps: tuple[str, ...], ascii: bool) -> tuple[str, ...]:
+    chain = [_algebra(step, ascii).equivalent_to or step for step in steps]
+    changed = True
+    while changed:
+        changed = False
+        # Shortening rewrites first, then sort commuting neighbours by
+        # op_type. Rewrites shrink the chain and swaps remove an
+        # inversion, so this terminates.
+        for i in range(len(chain) - 1):
+            replacement = _rewrite_pair(chain[i], chain[i + 1], ascii)
+            if replacement is not None:
+                chain[i : i + 2] = replacement
+                changed = True
+                break
+        else:
+            for i in range(len(chain) - 1):
+                first, second = chain[i], chain[i + 1]
+                if second < first and _commute(first, second, ascii):
+                    chain[i], chain[i + 1] = second, first
+                    changed = True
+                    break
+    return tuple(chain)
+
+
+def canonical_steps(steps: Sequence[str], *, ascii: bool) -> tuple[str, ...]:
+    """Normalize a chain of op_types (applied left to right).
+
+    Applies each op's declared laws until none applies and orders
+    commuting neighbours by op_type, so chains that differ only by
+    those laws get the same result. Results are cached. Equal results
+    imply equal functions on the domain; the converse is not promised.
+    """
+    return _canonical_steps(tuple(steps), ascii)
@@ -0,0 +1,285 @@
+"""Render backends turning op IR (genfxn.ops.ir) into source text.
+
+Every backend renders an expression over DEFAULT_STR_INPUT_VAR:
+
+- Python: ``input: str``, a str expression.
+- Java: ``String input``, a String expression.
+- Rust: ``input: &str``, a String expression.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Protocol
+
+from genfxn.ops.ir import Const, Expr, IfEmpty, Input, StrFn
+from genfxn.ops.registry import clear_op_cache
+from genfxn.types import DEFAULT_STR_INPUT_VAR, Lang
+
+_VAR = DEFAULT_STR_INPUT_VAR
+
+
+class RenderBackend(Protocol):
+    def render(self, expr: Expr) -> str:
+        """Render expr as an expression of the input string."""
+        ...
+
+
+def _escape_literal(value: str, escape: Callable[[int], str]) -> str:
+    """Quote value as a C-style string literal; escape(ord) escapes the
+    remaining non-printable chars."""
+    escaped: list[str] = []
+    for char in value:
+        if char in '\\"':
+            escaped.append("\\" + char)
+        elif char == "\n":
+            escaped.append("\\n")
+        elif char == "\r":
+            escaped.append("\\r")
+        elif char == "\t":
+            escaped.append("\\t")
+        elif not char.isprintable():
+            escaped.append(escape(ord(char)))
+        else:
+            escaped.append(char)
+    return '"' + "".join(escaped) + '"'
+
+
+def _java_escape(code: int) -> str:
+    return f"\\{code:03o}" if code < 0o400 else f"\\u{code:04x}"
+
+
+class PythonBackend:
+    def render(self, expr: Expr) -> str:
+        match expr:
+            case Input():
+                return _VAR
+            case Const(value=value):
+                return repr(value)
+            case IfEmpty(value=value, then=then, otherwise=otherwise):
+                return (
+                    f"{self._operand(then)} if len({self.render(value)}) == 0 "
+                    f"else {self._operand(otherwise)}"
+                )
+            case StrFn(fn="reverse", arg=arg):
+                return f"{self._operand(arg)}[::-1]"
+            case StrFn(fn="tab", arg=arg):
+                return f"('\\t' if {self._operand(arg)} else '')"
+            case StrFn(fn=fn, arg=arg, params=params):
+                args = ", ".join(str(param) for param in params)
+                return f"{self._operand(arg)}.{fn}({args})"
+        raise TypeError(f"Unsupported IR node: {expr!r}")
+
+    def _operand(self, expr: Expr) -> str:
+        rendered = self.render(expr)
+        return f"({rendered})" if isinstance(expr, IfEmpty) else rendered
+
+
+class JavaBackend:
+    # Helpers bind multiply-used or looped-over values through a lambda
+    # parameter so the argument expression is evaluated once.
+    _FN = "((java.util.function.Function<String, String>) _s -> {})"
+
+    def render(self, expr: Expr) -> str:
+        match expr:
+            case Input():
+                return _VAR
+            case Const(value=value):
+                # Octal: Java decodes \u escapes before lexing.
+                return _escape_literal(value, _java_escape)
+            case IfEmpty(value=value, then=then, otherwise=otherwise):
+                return (
+                    f"({self.render(value)}.isEmpty() ? "
+                    f"{self.render(then)} : {self.render(otherwise)})"
+                )
+            case StrFn(fn=fn, arg=arg, params=params):
+                return self._render_fn(fn, self.render(arg), params)
+        raise TypeError(f"Unsupported IR node: {expr!r}")
+
+    def _render_fn(self, fn: str, arg: str, params: tuple[int, ...]) -> str:
+        match fn:
+            case "lower" | "casefold":
+                return f"{arg}.toLowerCase(java.util.Locale.ROOT)"
+            case "upper":
+                return f"{arg}.toUpperCase(java.util.Locale.ROOT)"
+            case "swapcase":
+                return (
+                    f"{arg}.codePoints()"
+                    ".map(_c -> Character.isUpperCase(_c) ? "
+                    "Character.toLowerCase(_c) : Character.toUpperCase(_c))"
+                    ".collect(StringBuilder::new, "
+                    "StringBuilder::appendCodePoint, StringBuilder::append)"
+                    ".toString()"
+                )
+            case "capitalize":
+                body = (
+                    "_s.isEmpty() ? _s : "
+                    "_s.substring(0, 1).toUpperCase(java.util.Locale.ROOT) + "
+                    "_s.substring(1).toLowerCase(java.util.Locale.ROOT)"
+                )
+                return self._apply(body, arg)
+            case "title":
+                # Python's title() starts a word after any uncased char.
+                return (
+                    'java.util.regex.Pattern.compile("\\\\p{L}+")'
+                    f".matcher({arg})"
+                    ".replaceAll(_m -> _m.group().substring(0, 1)"
+                    ".toUpperCase(java.util.Locale.ROOT) + "
+                    "_m.group().substring(1)"
+                    ".toLowerCase(java.util.Locale.ROOT))"
+                )
+            case "strip":
+                return f"{arg}.strip()"
+            case "lstrip":
+                return f"{arg}.stripLeading()"
+            case "rstrip":
+                return f"{arg}.stripTrailing()"
+            case "expandtabs":
+                (tabsize,) = params
+                body = (
+                    "{ StringBuilder _b = new StringBuilder(); int _col = 0; "
+                    "for (char _c : _s.toCharArray()) { "
+                    "if (_c == '\\t') { "
+                    f"int _n = {tabsize} - _col % {tabsize}; "
+                    '_b.append(" ".repeat(_n)); _col += _n; } '
+                    "else { _b.append(_c); "
+                    "_col = _c == '\\n' || _c == '\\r' ? 0 : _col + 1; } } "
+                    "return _b.toString(); }"
+                )
+                return self._apply(body, arg)
+            case "reverse":
+                return f"new StringBuilder({arg}).reverse().toString()"
+            case "tab":
+                return f'({arg}.isEmpty() ? "" : "\\t")'
+        raise ValueError(f"Unsupported str fn for Java: '{fn}'")
+
+    def _apply(self, body: str, arg: str) -> str:
+        if arg == _VAR and not body.startswith("{"):
+            return "(" + body.replace("_s", _VAR) + ")"
+        return f"{self._FN.format(body)}.apply({arg})"
+
+
+class RustBackend:
+    # Python's str.isspace() also counts U+001C..U+001F as whitespace.
+    _IS_SPACE = (
+        "|c: char| c.is_whitespace() || ('\\u{1c}'..='\\u{1f}').contains(&c)"
+    )
+
+    def render(self, expr: Expr) -> str:
+        return self._owned(expr)
+
+    def _owned(self, expr: Expr) -> str:
+        """Render expr as an owned String."""
+        rendered = self._expr(expr)
+        if isinstance(expr, Input | Const):
+            return f"{rendered}.to_string()"
+        return rendered
+
+    def _operand(self, expr: Expr) -> str:
+        """Render expr as a method receiver (a str or String)."""
+        rendered = self._expr(expr)
+        if rendered.startswith(("if ", "{")):
+            return f"({rendered})"
+        return rendered
+
+    def _expr(self, expr: Expr) -> str:
+        match expr:
+            case Input():
+                return _VAR
+            case Const(value=value):
+                return _escape_literal(value, lambda code: f"\\u{{{code:x}}}")
+            case IfEmpty(value=value, then=then, otherwise=otherwise):
+                return (
+                    f"if {self._operand(value)}.is_empty() "
+                    f"{{ {self._owned(then)} }} "
+                    f"else {{ {self._owned(otherwise)} }}"
+                )
+            case StrFn(fn=fn, arg=arg, params=params):
+                return self._render_fn(fn, self._operand(arg), params)
+        raise TypeError(f"Unsupported IR node: {expr!r}")
+
+    def _render_fn(self, fn: str, arg: str, params: tuple[int, ...]) -> str:
+        match fn:
+            case "lower" | "casefold":
+                return f"{arg}.to_lowercase()"
+            case "upper":
+                return f"{arg}.to_uppercase()"
+            case "swapcase":
+                return (
+                    f"{arg}.chars().flat_map(|c| if c.is_uppercase() "
+                    "{ c.to_lowercase().collect::<Vec<char>>() } else "
+                    "{ c.to_uppercase().collect::<Vec<char>>() })"
+                    ".collect::<String>()"
+                )
+            case "capitalize":
+                return (
+                    f"{{ let _s = {arg}; let mut _chars = _s.chars(); "
+                    "match _chars.next() "
+                    "{ None => String::new(), "
+                    "Some(first) => first.to_uppercase().collect::<String>() + "
+                    "&_chars.as_str().to_lowercase(), } }"
+                )
+            case "title":
+                # Python's title() starts a word after any uncased char.
+                return (
+                    "{ let mut _prev = false; "
+                    f"{arg}.chars().flat_map(|c| {{ "
+                    "let _out = if _prev "
+                    "{ c.to_lowercase().collect::<Vec<char>>() } else "
+                    "{ c.to_uppercase().collect::<Vec<char>>() }; "
+                    "_prev = c.is_alphabetic(); _out }).collect::<String>() }"
+                )
+            case "strip":
+                return f"{arg}.trim_matches({self._IS_SPACE}).to_string()"
+            case "lstrip":
+                return f"{arg}.trim_start_matches({self._IS_SPACE}).to_string()"
+            case "rstrip":
+                return f"{arg}.trim_end_matches({self._IS_SPACE}).to_string()"
+            case "expandtabs":
+                (tabsize,) = params
+                return (
+                    "{ let mut _out = String::new(); let mut _col = 0usize; "
+                    f"for c in {arg}.chars() {{ if c == '\\t' {{ "
+                    f"let _n = {tabsize} - _col % {tabsize}; "
+                    "_out.extend(std::iter::repeat(' ').take(_n)); _col += _n; "
+                    "} else { _out.push(c); "
+                    "_col = if c == '\\n' || c == '\\r' { 0 } "
+                    "else { _col + 1 }; "
+                    "} } _out }"
+                )
+            case "reverse":
+                return f"{arg}.chars().rev().collect::<String>()"
+            case "tab":
+                return (
+                    f"if {arg}.is_empty() {{ String::new() }} "
+                    'else { "\\t".to_string() }'
+                )
+        raise ValueError(f"Unsupported str fn for Rust: '{fn}'")
+
+
+RENDER_BACKENDS: dict[Lang, RenderBackend] = {
+    Lang.PYTHON: PythonBackend(),
+    Lang.JAVA: JavaBackend(),
+    Lang.RUST: RustBackend(),
+}
+
+
+def register_backend(
+    language: Lang, backend: RenderBackend, *, replace: bool = False
+) -> None:
+    """Register the backend rendering IR for a language.
+
+    Text already rendered by live ops is memoized and kept; interned
+    ops are dropped so get_op hands out ops that use the new backend.
+    """
+    if language in RENDER_BACKENDS and not replace:
+        raise ValueError(f"language '{language}' already has a backend")
+    RENDER_BACKENDS[language] = backend
+    clear_op_cache()
+
+
+def render_ir(expr: Expr, language: Lang) -> str:
+    backend = RENDER_BACKENDS.get(language)
+    if backend is None:
+        raise ValueError(f"No render backend for language '{language}'")
+    return backend.render(expr)
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Callable, Mapping, Sequence
+from functools import cached_property
+from typing import Any, ClassVar, Self
 
 from pydantic import BaseModel, ConfigDict, Field, computed_field
 
+from genfxn.ops.algebra import OpAlgebra
+from genfxn.ops.backends import RENDER_BACKENDS, render_ir
+from genfxn.ops.compiled_python import load_python_callable
+from genfxn.ops.ir import Expr
+from genfxn.ops.result_cache import with_result_cache
 from genfxn.spaces.space import Space
-from genfxn.types import Lang, StrRenderFn
+from genfxn.string_column import StringColumn
+from genfxn.types import DEFAULT_STR_INPUT_VAR, Lang, StrRenderFn
+
+# Per-instance state computed on demand and kept in __dict__.
+_LAZY_STATE_KEYS = frozenset(
+    {"ir", "_rendered", "_compiled_python", "_result_cache", "_cum_weights"}
+)
 
 
 class BaseOp(BaseModel, ABC):
@@ -18,6 +31,12 @@ class BaseOp(BaseModel, ABC):
         arbitrary_types_allowed=True,
     )
 
+    # Whether eval is a pure function of the input. Only deterministic
+    # ops may be shared across callers.
+    deterministic: ClassVar[bool] = True
+    # Algebraic laws used to canonicalize op compositions.
+    algebra: ClassVar[OpAlgebra] = OpAlgebra()
+
     op_type: Any
     input_space: Space
     renderers: dict[Lang, StrRenderFn] = Field(
@@ -35,25 +54,153 @@ class BaseOp(BaseModel, ABC):
             },
         )
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        # Route eval through the opt-in result cache (see
+        # configure_result_cache); nondeterministic evals never are.
+        if cls.deterministic and "eval" in cls.__dict__:
+            setattr(cls, "eval", with_result_cache(cls.__dict__["eval"]))
+
+    def __getstate__(self) -> dict[Any, Any]:
+        state = super().__getstate__()
+        # Compiled callables and result caches are rebuilt lazily and do
+        # not pickle.
+        state["__dict__"] = {
+            key: value
+            for key, value in state["__dict__"].items()
+            if key not in _LAZY_STATE_KEYS
+        }
+        return state
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        # Lazy state, derived fields and bound renderers belong to the
+        # original's configuration.
+        for key in _LAZY_STATE_KEYS:
+            copied.__dict__.pop(key, None)
+        copied.model_post_init(None)
+        resolve = getattr(copied, "_resolve_derived", None)
+        if update and resolve is not None:
+            resolve()
+        return copied
+
     @computed_field(return_type=tuple[Lang, ...])
     @property
     def supported_languages(self) -> tuple[Lang, ...]:
-        return tuple(self.renderers.keys())
+        languages = list(self.renderers)
+        if self.ir is not None:
+            languages.extend(
+                lang for lang in RENDER_BACKENDS if lang not in self.renderers
+            )
+        return tuple(languages)
 
     def validate_input(self, **kwargs: Any) -> None:
         self.input_space.validate_member(**kwargs)
 
+    def validate_inputs(self, inputs: Sequence[Any]) -> None:
+        self.input_space.validate_members(inputs)
+
     @abstractmethod
     def eval(self, **kwargs: Any) -> Any:
         """Evaluate this op in Python."""
 
-    @abstractmethod
+    def eval_many(
+        self, inputs: Sequence[Any], *, validate: bool = True
+    ) -> list[Any]:
+        """Evaluate this op over a batch of input values.
+
+        Batch kernels validate the whole batch once up front, and skip it
+        when validate=False (e.g. for inputs drawn from this op's own
+        input_space.sample). This default defers to eval per item, which
+        always validates.
+        """
+        del validate
+        return [self.eval(**{DEFAULT_STR_INPUT_VAR: value}) for value in inputs]
+
+    def build_ir(self) -> Expr | None:
+        """Lower this op to language-neutral IR, or None if it has none.
+
+        Ops with IR render through every registered backend; ops without
+        it must override render_python.
+        """
+        return None
+
+    @cached_property
+    def ir(self) -> Expr | None:
+        """This op's IR, built once per instance."""
+        return self.build_ir()
+
     def render_python(self) -> str:
         """Render this op as a Python expression."""
+        ir = self.ir
+        if ir is None:
+            raise NotImplementedError(
+                f"{type(self).__name__} has no IR and must implement "
+                "render_python"
+            )
+        return render_ir(ir, Lang.PYTHON)
+
+    def eval_column(
+        self, inputs: Sequence[str], *, validate: bool = True
+    ) -> StringColumn:
+        """Like eval_many, packing the (ASCII string) outputs columnar."""
+        return StringColumn.from_strings(
+            self.eval_many(inputs, validate=validate)
+        )
+
+    @cached_property
+    def _compiled_python(self) -> Callable[[Any], Any]:
+        return load_python_callable(self.render(Lang.PYTHON))
+
+    def compile_python(self) -> Callable[[Any], Any]:
+        """Return render_python() compiled to a callable of the input.
+
+        Compiled once per op; the code object is shared across ops with
+        the same rendered text.
+        """
+        return self._compiled_python
+
+    def python_parity_mismatches(
+        self, inputs: Sequence[Any]
+    ) -> list[tuple[Any, Any, Any]]:
+        """Return (input, eval output, compiled output) for each mismatch."""
+        if not self.deterministic:
+            raise ValueError(
+                f"op_type '{self.op_type}' is nondeterministic; "
+                "eval/compile parity is undefined"
+            )
+        compiled = self.compile_python()
+        expected = self.eval_many(inputs)
+        mismatches: list[tuple[Any, Any, Any]] = []
+        for value, output in zip(inputs, expected, strict=True):
+            actual = compiled(value)
+            if actual != output:
+                mismatches.append((value, output, actual))
+        return mismatches
+
+    @cached_property
+    def _rendered(self) -> dict[Lang, str]:
+        return {}
 
     def render(self, language: Lang = Lang.PYTHON) -> str:
+        """Render this op in language, memoized per op and language.
+
+        Explicit renderers win; otherwise the op's IR goes through the
+        language's registered backend.
+        """
+        rendered = self._rendered
+        text = rendered.get(language)
+        if text is not None:
+            return text
         renderer = self.renderers.get(language)
-        if renderer is None:
+        if renderer is not None:
+            text = renderer()
+        elif self.ir is not None and language in RENDER_BACKENDS:
+            text = render_ir(self.ir, language)
+        else:
             supported = ", ".join(
                 lang.value for lang in self.supported_languages
             )
@@ -61,4 +208,5 @@ class BaseOp(BaseModel, ABC):
                 "Unsupported language "
                 f"'{language.value}'. Supported: {supported}"
             )
-        return renderer()
+        rendered[language] = text
+        return text
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+from genfxn.ops.algebra import canonical_steps, is_ascii_domain
+from genfxn.ops.base_op import BaseOp
+from genfxn.ops.compound_op import CompoundOp
+from genfxn.ops.mixture_op import MixtureOp
+from genfxn.ops.pipeline_op import PipelineOp
+from genfxn.ops.registry import get_op
+from genfxn.ops.string_ops.registry import STRING_OP_REGISTRY
+from genfxn.spaces.string_space import StringSpace
+from genfxn.trusted import construct_trusted
+
+# Mixture weights are normalized and rounded so that merge order does
+# not change the key.
+_WEIGHT_DIGITS = 12
+
+
+def _space_key(space: Any) -> Hashable:
+    try:
+        hash(space)
+    except TypeError:
+        return space.model_dump_json()
+    return space
+
+
+def op_chain(op: BaseOp) -> tuple[tuple[str, ...], Any] | None:
+    """Return (string op_types applied in order, input_space) for ops
+    that are a plain chain of string ops, else None."""
+    if isinstance(op, PipelineOp):
+        return op.steps, op.input_space
+    if isinstance(op, CompoundOp):
+        inner = op_chain(op.resolved_op)
+        return None if inner is None else (inner[0], op.input_space)
+    if op.op_type in STRING_OP_REGISTRY:
+        return (op.op_type,), op.input_space
+    return None
+
+
+def canonical_key(op: BaseOp) -> Hashable:
+    """Hashable canonical form of an op tree.
+
+    Chains (string ops, pipelines, compound ops) key on their input
+    space and canonical_steps. Mixtures key on the normalized weight of
+    each distinct canonical choice, i.e. on the distribution they draw
+    from rather than on RNG consumption. Other ops key on their JSON
+    dump. Ops with equal keys compute the same function (distribution
+    for mixtures) on their domain, so the key can dedupe generated ops
+    and key caches of downstream results.
+    """
+    chain = op_chain(op)
+    if chain is not None:
+        steps, space = chain
+        return (
+            "chain",
+            _space_key(space),
+            canonical_steps(steps, ascii=is_ascii_domain(space)),
+        )
+    if isinstance(op, MixtureOp):
+        total = sum(op.weights)
+        merged: dict[Hashable, float] = {}
+        for leaf, weight in zip(op.resolved_ops, op.weights, strict=True):
+            key = canonical_key(leaf)
+            merged[key] = merged.get(key, 0.0) + weight / total
+        return (
+            "mixture",
+            _space_key(op.input_space),
+            frozenset(
+                (key, round(weight, _WEIGHT_DIGITS))
+                for key, weight in merged.items()
+            ),
+        )
+    return ("op", op.model_dump_json())
+
+
+def simplify(op: BaseOp) -> BaseOp:
+    """Return an equivalent op with its step chain in canonical form.
+
+    Chains over a StringSpace become one leaf op or a PipelineOp.
+    Mixtures whose choices reduce to single ops merge choices that
+    become the same op, summing their weights. Anything else is
+    returned as is.
+    """
+    chain = op_chain(op)
+    if chain is not None:
+        steps, space = chain
+        if not isinstance(space, StringSpace):
+            return op
+        reduced = canonical_steps(steps, ascii=is_ascii_domain(space))
+        if len(reduced) == 1:
+            return get_op(reduced[0], input_space=space)
+        return construct_trusted(PipelineOp, steps=reduced, input_space=space)
+
+    if isinstance(op, MixtureOp):
+        ascii = is_ascii_domain(op.input_space)
+        merged: dict[str, float] = {}
+        for op_type, weight in zip(op.choices, op.weights, strict=True):
+            reduced = canonical_steps((op_type,), ascii=ascii)
+            if len(reduced) != 1:
+                return op
+            merged[reduced[0]] = merged.get(reduced[0], 0.0) + weight
+        if tuple(merged) == op.choices:
+            return op
+        return MixtureOp(
+            choices=tuple(merged),
+            weights=tuple(merged.values()),
+            input_space=op.input_space,
+            rng=op.rng,
+        )
+    return op
+
+
+def dedupe_ops(ops: Iterable[BaseOp]) -> list[BaseOp]:
+    """Keep the first op of each canonical_key, in order."""
+    seen: set[Hashable] = set()
+    unique: list[BaseOp] = []
+    for op in ops:
+        key = canonical_key(op)
+        if key not in seen:
+            seen.add(key)
+            unique.append(op)
+    return unique
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import ast
+import builtins
+from collections.abc import Callable
+from functools import lru_cache
+from types import CodeType
+from typing import Any
+
+from genfxn.types import DEFAULT_STR_INPUT_VAR
+
+PYTHON_CODE_CACHE_MAXSIZE = 1024
+
+_FILENAME = "<genfxn>"
+
+
+@lru_cache(maxsize=PYTHON_CODE_CACHE_MAXSIZE)
+def compile_python_source(source: str) -> tuple[CodeType, str | None]:
+    """Compile rendered Python source to a cached code object.
+
+    A single expression over DEFAULT_STR_INPUT_VAR compiles to a lambda
+    (returned with no function name). Otherwise the source must be one
+    function definition, whose name is returned alongside the code.
+    """
+    module = ast.parse(source)
+    if len(module.body) == 1:
+        node = module.body[0]
+        if isinstance(node, ast.Expr):
+            code = compile(
+                f"lambda {DEFAULT_STR_INPUT_VAR}: ({source})",
+                _FILENAME,
+                "eval",
+            )
+            return code, None
+        if isinstance(node, ast.FunctionDef):
+            return compile(module, _FILENAME, "exec"), node.name
+    raise ValueError(
+        "rendered Python must be an expression or a single function def"
+    )
+
+
+def load_python_callable(source: str) -> Callable[[Any], Any]:
+    """Build a callable of the input value from rendered Python source.
+
+    Each call executes the cached code in a fresh namespace, so compiled
+    ops never share globals.
+    """
+    code, fn_name = compile_python_source(source)
+    namespace: dict[str, Any] = {"__builtins__": builtins}
+    if fn_name is None:
+        return eval(code, namespace)
+    exec(code, namespace)
+    return namespace[fn_name]
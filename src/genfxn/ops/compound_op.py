@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import cache
 from typing import Any
 
 from pydantic import Field
 
 from genfxn.ops.base_op import BaseOp
+from genfxn.ops.ir import Expr
+from genfxn.ops.registry import get_op
 from genfxn.spaces.categorical_space import CategoricalSpace
+from genfxn.spaces.enumeration import IndexedProduct
+from genfxn.trusted import construct_trusted
+from genfxn.types import Lang
 
 
 class CompoundOp(BaseOp):
@@ -22,16 +29,72 @@ class CompoundOp(BaseOp):
     transform_space: CategoricalSpace
     resolved_op: Any = Field(default=None, exclude=True, repr=False)
 
+    @classmethod
+    def enumerate_configs(
+        cls,
+        inputs: Sequence[Any] | None = None,
+        transform_space: CategoricalSpace | None = None,
+    ) -> IndexedProduct:
+        """Lazily enumerate every (op, input) pair for coverage sweeps.
+
+        Transforms range over ``transform_space`` (default: the class
+        default). ``inputs`` defaults to every value of the default
+        input_space when it is categorical. Items are ordered by
+        transform, then input, with O(1) access by index, so index
+        ranges shard a full sweep. Each op is built once per transform.
+        """
+        # Transforms drawn from the default space are valid by
+        # construction, so those ops skip validation.
+        trusted = transform_space is None
+        if transform_space is None:
+            transform_space = cls.model_fields["transform_space"].get_default(
+                call_default_factory=True
+            )
+        if inputs is None:
+            input_space = cls.model_fields["input_space"].get_default(
+                call_default_factory=True
+            )
+            if not isinstance(input_space, CategoricalSpace):
+                raise ValueError(
+                    "inputs are required when input_space is not categorical"
+                )
+            inputs = input_space.enumerate()
+
+        @cache
+        def build(transform: Any) -> CompoundOp:
+            if trusted:
+                return construct_trusted(
+                    cls, transform=transform, transform_space=transform_space
+                )
+            # Subclasses default op_type and input_space; validate via
+            # model_validate since the base signature requires them.
+            return cls.model_validate(
+                {"transform": transform, "transform_space": transform_space}
+            )
+
+        return IndexedProduct(
+            (transform_space.enumerate(), inputs),
+            build=lambda transform, value: (build(transform), value),
+        )
+
     def model_post_init(self, __context: Any) -> None:
         super().model_post_init(__context)
-        from genfxn.ops.registry import build_op
-
-        resolved = build_op(self.transform)
+        resolved = get_op(self.transform)
         object.__setattr__(self, "resolved_op", resolved)
 
     def eval(self, **kwargs: Any) -> Any:
         self.validate_input(**kwargs)
         return self.resolved_op.eval(**kwargs)
 
+    def eval_many(
+        self, inputs: Sequence[Any], *, validate: bool = True
+    ) -> list[Any]:
+        if validate:
+            self.validate_inputs(inputs)
+        return self.resolved_op.eval_many(inputs, validate=validate)
+
+    def build_ir(self) -> Expr | None:
+        return self.resolved_op.ir
+
     def render_python(self) -> str:
-        return self.resolved_op.render_python()
+        return self.resolved_op.render(Lang.PYTHON)
@@ -0,0 +1,74 @@
+"""Language-neutral expression IR for str -> str ops.
+
+An op lowers itself to an IR tree once (``BaseOp.ir``) and render
+backends (see genfxn.ops.backends) turn that tree into source text for
+each target language.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# Primitive string functions a backend must implement. Each maps "" to
+# "" and matches Python's str semantics on ASCII input.
+STR_FNS = frozenset(
+    {
+        "lower",
+        "upper",
+        "casefold",
+        "swapcase",
+        "capitalize",
+        "title",
+        "strip",
+        "lstrip",
+        "rstrip",
+        "expandtabs",
+        "reverse",
+        # "\t" for a non-empty string, "" otherwise.
+        "tab",
+    }
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Input:
+    """The op's input string."""
+
+
+@dataclass(frozen=True, slots=True)
+class Const:
+    value: str
+
+
+@dataclass(frozen=True, slots=True)
+class StrFn:
+    """A primitive from STR_FNS applied to arg, with int params."""
+
+    fn: str
+    arg: Expr
+    params: tuple[int, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.fn not in STR_FNS:
+            raise ValueError(
+                f"Unknown str fn '{self.fn}'. Valid: {sorted(STR_FNS)}"
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class IfEmpty:
+    """then if value is empty, else otherwise."""
+
+    value: Expr
+    then: Expr
+    otherwise: Expr
+
+
+type Expr = Input | Const | StrFn | IfEmpty
+
+INPUT = Input()
+
+
+def guarded(expr: Expr) -> IfEmpty:
+    """Return expr guarded to pass the empty input through unchanged."""
+    return IfEmpty(INPUT, INPUT, expr)
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import importlib
+from functools import cache
+from typing import Any
+
+
+@cache
+def import_target(target: str) -> Any:
+    """Import and return the object named by a ``module:attr`` path.
+
+    Used by the op registries so op modules load on first use rather
+    than when the registry is imported.
+    """
+    module_name, sep, attr = target.partition(":")
+    if not sep or not module_name or not attr:
+        raise ValueError(f"expected 'module:attr' target, got {target!r}")
+    module = importlib.import_module(module_name)
+    try:
+        return getattr(module, attr)
+    except AttributeError:
+        raise ImportError(
+            f"module '{module_name}' has no attribute '{attr}'"
+        ) from None
@@ -1,23 +1,31 @@
 from __future__ import annotations
 
+import itertools
 import random
-from typing import Any, Literal
+from collections.abc import Sequence
+from functools import cached_property
+from typing import Any, ClassVar, Literal
 
 from pydantic import Field, model_validator
 
 from genfxn.ops.base_op import BaseOp
+from genfxn.ops.registry import get_op
+from genfxn.rng import draw_keyed
 from genfxn.spaces.space import Space
-from genfxn.types import DEFAULT_STR_INPUT_VAR
+from genfxn.types import DEFAULT_STR_INPUT_VAR, Lang
 
 
 class MixtureOp(BaseOp):
     """Weighted random choice over registered operations."""
 
+    deterministic: ClassVar[bool] = False
+
     op_type: Literal["mixture"] = "mixture"
     choices: tuple[str, ...]
-    weights: list[float] = Field(min_length=1)
+    weights: tuple[float, ...] = Field(min_length=1)
     input_space: Space
     rng: random.Random = Field(default_factory=random.Random, exclude=True)
+    resolved_ops: tuple[Any, ...] = Field(default=(), exclude=True, repr=False)
 
     @model_validator(mode="after")
     def validate_mixture(self) -> MixtureOp:
@@ -32,38 +40,101 @@ class MixtureOp(BaseOp):
         if any(weight <= 0 for weight in self.weights):
             raise ValueError("weights must be > 0")
 
-        # Ensure every referenced op_type exists and can share input_space.
-        from genfxn.ops.registry import build_op
+        self._resolve_derived()
+        return self
 
-        for op_type in self.choices:
-            build_op(op_type, input_space=self.input_space)
+    def _resolve_derived(self) -> None:
+        # Ensure every referenced op_type exists and can share input_space,
+        # keeping the resolved leaf ops for eval and render.
+        resolved = tuple(
+            get_op(op_type, input_space=self.input_space)
+            for op_type in self.choices
+        )
+        object.__setattr__(self, "resolved_ops", resolved)
+
+    @cached_property
+    def _cum_weights(self) -> tuple[float, ...] | None:
+        # Unit weights give cum_weights 1.0..n, which rng.choices draws
+        # exactly like unweighted choices but without the bisect.
+        if all(weight == 1.0 for weight in self.weights):
+            return None
+        return tuple(itertools.accumulate(self.weights))
+
+    def sample_choice_indices(
+        self, n_samples: int, rng: random.Random
+    ) -> list[int]:
+        """Draw mixture indices, consuming ``rng`` like n_samples evals.
+
+        Uses the cached cumulative weights, which draws exactly what
+        ``rng.choices(..., weights=self.weights)`` would.
+        """
+        if n_samples < 0:
+            raise ValueError("n_samples must be >= 0")
+
+        return rng.choices(
+            population=range(len(self.choices)),
+            cum_weights=self._cum_weights,
+            k=n_samples,
+        )
 
-        return self
+    def sample_choice_indices_keyed(
+        self, seed: int, start: int, stop: int
+    ) -> list[int]:
+        """Draw indices [start, stop) of the (seed, index)-keyed stream."""
+        return draw_keyed(self.sample_choice_indices, seed, start, stop)
 
     def eval(self, **kwargs: Any) -> Any:
-        from genfxn.ops.registry import build_op
-
         self.validate_input(**kwargs)
 
-        idx = self.rng.choices(
-            population=range(len(self.choices)),
-            weights=self.weights,
-            k=1,
-        )[0]
-        chosen = self.choices[idx]
-        op = build_op(chosen, input_space=self.input_space)
+        idx = self.sample_choice_indices(1, self.rng)[0]
+        op = self.resolved_ops[idx]
         op.validate_input(**kwargs)
         return op.eval(**kwargs)
 
-    def render_python(self) -> str:
-        from genfxn.ops.registry import build_op
+    def eval_many(
+        self,
+        inputs: Sequence[Any],
+        *,
+        validate: bool = True,
+        seed: int | None = None,
+        start: int = 0,
+    ) -> list[Any]:
+        """Evaluate a batch, drawing every mixture index up front.
+
+        By default consumes ``rng`` exactly like len(inputs) sequential
+        evals. With ``seed``, input i instead uses index start + i of the
+        keyed stream, so shards of a batch evaluate independently. Inputs
+        are grouped by chosen leaf op and each group runs as one batch.
+        """
+        if validate:
+            self.validate_inputs(inputs)
+
+        if seed is None:
+            indices = self.sample_choice_indices(len(inputs), self.rng)
+        else:
+            indices = self.sample_choice_indices_keyed(
+                seed, start, start + len(inputs)
+            )
+        groups: list[list[int]] = [[] for _ in self.resolved_ops]
+        for pos, idx in enumerate(indices):
+            groups[idx].append(pos)
+
+        outputs: list[Any] = [None] * len(inputs)
+        for op, positions in zip(self.resolved_ops, groups, strict=True):
+            if not positions:
+                continue
+            # Leaf ops share input_space, so the batch is already valid.
+            group_outputs = op.eval_many(
+                [inputs[pos] for pos in positions], validate=False
+            )
+            for pos, output in zip(positions, group_outputs, strict=True):
+                outputs[pos] = output
+        return outputs
 
-        choice_exprs: list[str] = []
-        for op_type in self.choices:
-            op = build_op(op_type, input_space=self.input_space)
-            choice_exprs.append(op.render_python())
+    def render_python(self) -> str:
+        choice_exprs = [op.render(Lang.PYTHON) for op in self.resolved_ops]
         population = list(range(len(self.choices)))
-        weights_expr = repr(self.weights)
+        weights_expr = repr(list(self.weights))
         lines = [
             f"def mixture_generated({DEFAULT_STR_INPUT_VAR}):",
             "    import random as _random",
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Literal
+
+from pydantic import Field, model_validator
+
+from genfxn.ops.algebra import canonical_steps, is_ascii_domain
+from genfxn.ops.base_op import BaseOp
+from genfxn.ops.ir import INPUT, Expr, StrFn
+from genfxn.ops.string_ops.registry import STRING_OP_REGISTRY
+from genfxn.spaces.string_space import StringSpace
+from genfxn.types import DEFAULT_EXPANDTABS_TABSIZE, DEFAULT_STR_INPUT_VAR
+
+# IR str fn and params per string op_type. Every string op maps "" to
+# "", so the leaf ops' empty-input guards are redundant inside a chain.
+_STEP_FNS: dict[str, tuple[str, tuple[int, ...]]] = {
+    "lower_str": ("lower", ()),
+    "upper_str": ("upper", ()),
+    "capitalize_str": ("capitalize", ()),
+    "swapcase_str": ("swapcase", ()),
+    "tab_str": ("tab", ()),
+    "reverse_str": ("reverse", ()),
+    "casefold_str": ("casefold", ()),
+    "title_str": ("title", ()),
+    "strip_str": ("strip", ()),
+    "lstrip_str": ("lstrip", ()),
+    "rstrip_str": ("rstrip", ()),
+    "expandtabs_str": ("expandtabs", (DEFAULT_EXPANDTABS_TABSIZE,)),
+}
+
+
+class PipelineOp(BaseOp):
+    """Chain of registered string ops, applied left to right.
+
+    The input is validated once against this op's input_space;
+    intermediate values are not revalidated. Steps are reduced with the
+    ops' declared algebraic laws (see canonical_steps), and the chain
+    lowers to one IR expression, so it evaluates as a single compiled
+    Python expression. An empty pipeline is the identity.
+    """
+
+    op_type: Literal["pipeline"] = "pipeline"
+    steps: tuple[str, ...]
+    input_space: StringSpace = Field(default_factory=StringSpace)
+    fused_steps: tuple[str, ...] = Field(default=(), exclude=True, repr=False)
+
+    @model_validator(mode="after")
+    def validate_steps(self) -> PipelineOp:
+        invalid = [step for step in self.steps if step not in _STEP_FNS]
+        if invalid:
+            raise ValueError(
+                f"Unsupported pipeline step(s): {invalid}. "
+                f"Valid: {sorted(STRING_OP_REGISTRY)}"
+            )
+
+        self._resolve_derived()
+        return self
+
+    def _resolve_derived(self) -> None:
+        fused = canonical_steps(
+            self.steps, ascii=is_ascii_domain(self.input_space)
+        )
+        object.__setattr__(self, "fused_steps", fused)
+
+    def eval(self, **kwargs: Any) -> str:
+        self.validate_input(**kwargs)
+        return self.compile_python()(kwargs[DEFAULT_STR_INPUT_VAR])
+
+    def eval_many(
+        self, inputs: Sequence[str], *, validate: bool = True
+    ) -> list[str]:
+        if validate:
+            self.validate_inputs(inputs)
+        return list(map(self.compile_python(), inputs))
+
+    def build_ir(self) -> Expr:
+        expr: Expr = INPUT
+        for step in self.fused_steps:
+            fn, params = _STEP_FNS[step]
+            expr = StrFn(fn, expr, params)
+        return expr
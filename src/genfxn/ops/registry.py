@@ -1,31 +1,130 @@
 from __future__ import annotations
 
-from typing import Any
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Any
 
-from genfxn.ops.base_op import BaseOp
-from genfxn.ops.mixture_op import MixtureOp
+from genfxn.ops.lazy_import import import_target
 from genfxn.ops.string_ops.registry import STRING_OP_REGISTRY
 
-OpClass = type[BaseOp]
+if TYPE_CHECKING:
+    from genfxn.ops.base_op import BaseOp
 
-OP_REGISTRY: dict[str, OpClass] = {
+OpClass = type["BaseOp"]
+
+OP_CACHE_MAXSIZE = 1024
+
+# Entry point group scanned for third-party ops. Each entry point's name
+# is the op_type and its value the "module:Class" path, e.g. in
+# pyproject.toml:
+#
+#     [project.entry-points."genfxn.ops"]
+#     my_op = "my_package.ops:MyOp"
+OP_ENTRY_POINT_GROUP = "genfxn.ops"
+
+# op_type -> "module:Class" (imported on first use) or an op class.
+OP_REGISTRY: dict[str, str | OpClass] = {
     **STRING_OP_REGISTRY,
-    "mixture": MixtureOp,
+    "mixture": "genfxn.ops.mixture_op:MixtureOp",
+    "pipeline": "genfxn.ops.pipeline_op:PipelineOp",
 }
 
+_plugins_loaded = False
+
+
+def load_op_plugins() -> None:
+    """Register ops advertised under OP_ENTRY_POINT_GROUP, once.
+
+    Only the entry point metadata is read; plugin modules are imported
+    when their op is first used. Already-registered op_types win.
+    """
+    global _plugins_loaded
+    if _plugins_loaded:
+        return
+    _plugins_loaded = True
+
+    from importlib.metadata import entry_points
+
+    for entry_point in entry_points(group=OP_ENTRY_POINT_GROUP):
+        OP_REGISTRY.setdefault(entry_point.name, entry_point.value)
+
+
+def register_op(
+    op_type: str, target: str | OpClass, *, replace: bool = False
+) -> None:
+    """Register an op class, or its lazy "module:Class" path."""
+    if op_type in OP_REGISTRY and not replace:
+        raise ValueError(f"op_type '{op_type}' is already registered")
+    if not isinstance(target, str):
+        _check_op_cls(target, repr(target))
+    OP_REGISTRY[op_type] = target
+    # Interned ops may have been built from a replaced class.
+    clear_op_cache()
+
 
 def list_op_types() -> tuple[str, ...]:
+    load_op_plugins()
     return tuple(sorted(OP_REGISTRY.keys()))
 
 
+def _check_op_cls(op_cls: Any, name: str) -> OpClass:
+    from genfxn.ops.base_op import BaseOp
+
+    if not (isinstance(op_cls, type) and issubclass(op_cls, BaseOp)):
+        raise TypeError(f"{name} is not a BaseOp subclass")
+    return op_cls
+
+
+@cache
+def _load_op_cls(target: str) -> OpClass:
+    return _check_op_cls(import_target(target), repr(target))
+
+
 def get_op_cls(op_type: str) -> OpClass:
-    op_cls = OP_REGISTRY.get(op_type)
-    if op_cls is None:
+    target = OP_REGISTRY.get(op_type)
+    if target is None:
+        load_op_plugins()
+        target = OP_REGISTRY.get(op_type)
+    if target is None:
         supported = ", ".join(list_op_types())
         raise ValueError(f"Unknown op_type '{op_type}'. Supported: {supported}")
-    return op_cls
+    if isinstance(target, str):
+        return _load_op_cls(target)
+    return target
 
 
 def build_op(op_type: str, **kwargs: Any) -> BaseOp:
     op_cls = get_op_cls(op_type)
     return op_cls(**kwargs)
+
+
+@lru_cache(maxsize=OP_CACHE_MAXSIZE)
+def _build_interned_op(
+    op_type: str, kwargs_items: tuple[tuple[str, Any], ...]
+) -> BaseOp:
+    return build_op(op_type, **dict(kwargs_items))
+
+
+def get_op(op_type: str, **kwargs: Any) -> BaseOp:
+    """Return a shared op instance for this configuration.
+
+    Deterministic ops are frozen, so equal configurations can reuse one
+    instance from a bounded LRU. Nondeterministic ops and unhashable
+    kwargs (e.g. spaces holding a mixture) fall back to build_op.
+    """
+    if not get_op_cls(op_type).deterministic:
+        return build_op(op_type, **kwargs)
+    kwargs_items = tuple(sorted(kwargs.items()))
+    try:
+        hash(kwargs_items)
+    except TypeError:
+        return build_op(op_type, **kwargs)
+    return _build_interned_op(op_type, kwargs_items)
+
+
+def op_cache_info() -> Any:
+    """Return hit/miss/size statistics for the get_op cache."""
+    return _build_interned_op.cache_info()
+
+
+def clear_op_cache() -> None:
+    _build_interned_op.cache_clear()
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import functools
+import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from genfxn.types import DEFAULT_STR_INPUT_VAR
+
+if TYPE_CHECKING:
+    from genfxn.ops.base_op import BaseOp
+
+DEFAULT_RESULT_CACHE_MAX_ENTRIES = 4_096
+DEFAULT_RESULT_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
+_RESULT_CACHE_ATTR = "_result_cache"
+
+
+@dataclass(frozen=True)
+class ResultCacheConfig:
+    max_entries: int = DEFAULT_RESULT_CACHE_MAX_ENTRIES
+    max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES
+
+    def __post_init__(self) -> None:
+        if self.max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if self.max_bytes < 1:
+            raise ValueError("max_bytes must be >= 1")
+
+
+@dataclass(frozen=True)
+class ResultCacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """LRU of input -> eval output bounded by entries and bytes.
+
+    Entry size is sys.getsizeof of the key plus the output, which is
+    exact for the str inputs and outputs of string ops. Outputs larger
+    than the whole budget are not stored.
+    """
+
+    __slots__ = (
+        "config",
+        "_entries",
+        "_lock",
+        "_nbytes",
+        "_hits",
+        "_misses",
+        "_evictions",
+    )
+
+    def __init__(self, config: ResultCacheConfig) -> None:
+        self.config = config
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._nbytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> tuple[bool, Any]:
+        """Return (hit, output), marking a hit as most recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, entry[0]
+
+    def put(self, key: Hashable, output: Any) -> None:
+        size = sys.getsizeof(key) + sys.getsizeof(output)
+        config = self.config
+        if size > config.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._nbytes -= old[1]
+            self._entries[key] = (output, size)
+            self._nbytes += size
+            while (
+                self._nbytes > config.max_bytes
+                or len(self._entries) > config.max_entries
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_size
+                self._evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._nbytes = 0
+
+    def stats(self) -> ResultCacheStats:
+        with self._lock:
+            return ResultCacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                nbytes=self._nbytes,
+            )
+
+
+# Op class -> config. Op types are opted in explicitly.
+_RESULT_CACHE_CONFIGS: dict[type[BaseOp], ResultCacheConfig] = {}
+
+
+def configure_result_cache(
+    op_cls: type[BaseOp],
+    *,
+    max_entries: int = DEFAULT_RESULT_CACHE_MAX_ENTRIES,
+    max_bytes: int = DEFAULT_RESULT_CACHE_MAX_BYTES,
+) -> None:
+    """Memoize eval for every op of op_cls, within a per-op budget.
+
+    Each op instance gets its own cache. Reconfiguring replaces the
+    caches of existing instances on their next eval.
+    """
+    if not op_cls.deterministic:
+        raise ValueError(
+            f"{op_cls.__name__} is nondeterministic; its eval results "
+            "cannot be cached"
+        )
+    _RESULT_CACHE_CONFIGS[op_cls] = ResultCacheConfig(
+        max_entries=max_entries, max_bytes=max_bytes
+    )
+
+
+def disable_result_cache(op_cls: type[BaseOp]) -> None:
+    _RESULT_CACHE_CONFIGS.pop(op_cls, None)
+
+
+def result_cache_stats(op: Any) -> ResultCacheStats | None:
+    """Return op's cache statistics, or None if it has no cache yet."""
+    cache = op.__dict__.get(_RESULT_CACHE_ATTR)
+    return None if cache is None else cache.stats()
+
+
+def _cache_key(kwargs: dict[str, Any]) -> Hashable:
+    if len(kwargs) == 1:
+        value = kwargs.get(DEFAULT_STR_INPUT_VAR)
+        if type(value) is str:
+            return value
+    # Key on types too, so e.g. 1 and True stay distinct.
+    return tuple(
+        (name, type(value), value) for name, value in sorted(kwargs.items())
+    )
+
+
+def with_result_cache(
+    eval_fn: Callable[..., Any],
+) -> Callable[..., Any]:
+    """Wrap an op's eval to go through its configured result cache.
+
+    Ops of unconfigured types pay one dict lookup. Cache hits skip
+    input validation: an equal input already passed it.
+    """
+
+    @functools.wraps(eval_fn)
+    def eval(self: Any, **kwargs: Any) -> Any:
+        config = _RESULT_CACHE_CONFIGS.get(type(self))
+        if config is None:
+            return eval_fn(self, **kwargs)
+
+        cache = self.__dict__.get(_RESULT_CACHE_ATTR)
+        if cache is None or cache.config is not config:
+            cache = ResultCache(config)
+            self.__dict__[_RESULT_CACHE_ATTR] = cache
+        key = _cache_key(kwargs)
+        try:
+            hit, output = cache.get(key)
+        except TypeError:  # Unhashable input.
+            return eval_fn(self, **kwargs)
+        if not hit:
+            output = eval_fn(self, **kwargs)
+            cache.put(key, output)
+        return output
+
+    return eval
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Literal, cast
+from collections.abc import Sequence
+from typing import Any, ClassVar, Literal, cast
 
 from pydantic import Field
 
+from genfxn.ops.algebra import OpAlgebra
 from genfxn.ops.base_op import BaseOp
+from genfxn.ops.ir import INPUT, Expr, StrFn, guarded
 from genfxn.spaces.string_space import StringSpace
-from genfxn.templates.str_templates import (
-    eval_guarded_str_expr,
-    render_guarded_str_method,
-)
+from genfxn.templates.str_templates import eval_guarded_str_expr
 from genfxn.types import DEFAULT_STR_INPUT_VAR
 
 
@@ -18,11 +18,21 @@ class CasefoldStrOp(BaseOp):
 
     op_type: Literal["casefold_str"] = "casefold_str"
     input_space: StringSpace = Field(default_factory=StringSpace)
+    algebra: ClassVar[OpAlgebra] = OpAlgebra(
+        on_ascii=OpAlgebra(equivalent_to="lower_str")
+    )
 
     def eval(self, **kwargs: Any) -> str:
         self.validate_input(**kwargs)
         input = cast(str, kwargs[DEFAULT_STR_INPUT_VAR])
         return eval_guarded_str_expr(input, str.casefold)
 
-    def render_python(self) -> str:
-        return render_guarded_str_method("casefold")
+    def eval_many(
+        self, inputs: Sequence[str], *, validate: bool = True
+    ) -> list[str]:
+        if validate:
+            self.validate_inputs(inputs)
+        return list(map(str.casefold, inputs))
+
+    def build_ir(self) -> Expr:
+        return guarded(StrFn("casefold", INPUT))
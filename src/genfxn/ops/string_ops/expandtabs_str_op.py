@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Literal, cast
+from collections.abc import Sequence
+from typing import Any, ClassVar, Literal, cast
 
 from pydantic import Field
 
+from genfxn.ops.algebra import OpAlgebra
 from genfxn.ops.base_op import BaseOp
+from genfxn.ops.ir import INPUT, Expr, StrFn, guarded
 from genfxn.spaces.string_space import StringSpace
-from genfxn.templates.str_templates import (
-    eval_guarded_str_expr,
-    render_guarded_str_method_with_args,
-)
+from genfxn.templates.str_templates import eval_guarded_str_expr
 from genfxn.types import DEFAULT_EXPANDTABS_TABSIZE, DEFAULT_STR_INPUT_VAR
 
 
@@ -18,6 +18,10 @@ class ExpandtabsStrOp(BaseOp):
 
     op_type: Literal["expandtabs_str"] = "expandtabs_str"
     input_space: StringSpace = Field(default_factory=StringSpace)
+    algebra: ClassVar[OpAlgebra] = OpAlgebra(
+        idempotent=True,
+        on_ascii=OpAlgebra(commutes_with=frozenset({"rstrip_str"})),
+    )
 
     def eval(self, **kwargs: Any) -> str:
         self.validate_input(**kwargs)
@@ -27,8 +31,16 @@ class ExpandtabsStrOp(BaseOp):
             lambda s: s.expandtabs(DEFAULT_EXPANDTABS_TABSIZE),
         )
 
-    def render_python(self) -> str:
-        return render_guarded_str_method_with_args(
-            method_name="expandtabs",
-            args=str(DEFAULT_EXPANDTABS_TABSIZE),
+    def eval_many(
+        self, inputs: Sequence[str], *, validate: bool = True
+    ) -> list[str]:
+        if validate:
+            self.validate_inputs(inputs)
+        return [
+            input.expandtabs(DEFAULT_EXPANDTABS_TABSIZE) for input in inputs
+        ]
+
+    def build_ir(self) -> Expr:
+        return guarded(
+            StrFn("expandtabs", INPUT, (DEFAULT_EXPANDTABS_TABSIZE,))
         )
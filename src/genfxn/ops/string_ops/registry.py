@@ -1,36 +1,30 @@
 from __future__ import annotations
 
-from typing import Any
-
-from genfxn.ops.base_op import BaseOp
-from genfxn.ops.string_ops.capitalize_str_op import CapitalizeStrOp
-from genfxn.ops.string_ops.casefold_str_op import CasefoldStrOp
-from genfxn.ops.string_ops.expandtabs_str_op import ExpandtabsStrOp
-from genfxn.ops.string_ops.lower_str_op import LowerStrOp
-from genfxn.ops.string_ops.lstrip_str_op import LstripStrOp
-from genfxn.ops.string_ops.reverse_str_op import ReverseStrOp
-from genfxn.ops.string_ops.rstrip_str_op import RstripStrOp
-from genfxn.ops.string_ops.strip_str_op import StripStrOp
-from genfxn.ops.string_ops.swapcase_str_op import SwapcaseStrOp
-from genfxn.ops.string_ops.tab_str_op import TabStrOp
-from genfxn.ops.string_ops.title_str_op import TitleStrOp
-from genfxn.ops.string_ops.upper_str_op import UpperStrOp
-
-StringOpClass = type[BaseOp]
-
-STRING_OP_REGISTRY: dict[str, StringOpClass] = {
-    "lower_str": LowerStrOp,
-    "upper_str": UpperStrOp,
-    "capitalize_str": CapitalizeStrOp,
-    "swapcase_str": SwapcaseStrOp,
-    "tab_str": TabStrOp,
-    "reverse_str": ReverseStrOp,
-    "casefold_str": CasefoldStrOp,
-    "title_str": TitleStrOp,
-    "strip_str": StripStrOp,
-    "lstrip_str": LstripStrOp,
-    "rstrip_str": RstripStrOp,
-    "expandtabs_str": ExpandtabsStrOp,
+from typing import TYPE_CHECKING, Any
+
+from genfxn.ops.lazy_import import import_target
+
+if TYPE_CHECKING:
+    from genfxn.ops.base_op import BaseOp
+
+StringOpClass = type["BaseOp"]
+
+_MODULE = "genfxn.ops.string_ops"
+
+# op_type -> "module:Class", imported on first use.
+STRING_OP_REGISTRY: dict[str, str] = {
+    "lower_str": f"{_MODULE}.lower_str_op:LowerStrOp",
+    "upper_str": f"{_MODULE}.upper_str_op:UpperStrOp",
+    "capitalize_str": f"{_MODULE}.capitalize_str_op:CapitalizeStrOp",
+    "swapcase_str": f"{_MODULE}.swapcase_str_op:SwapcaseStrOp",
+    "tab_str": f"{_MODULE}.tab_str_op:TabStrOp",
+    "reverse_str": f"{_MODULE}.reverse_str_op:ReverseStrOp",
+    "casefold_str": f"{_MODULE}.casefold_str_op:CasefoldStrOp",
+    "title_str": f"{_MODULE}.title_str_op:TitleStrOp",
+    "strip_str": f"{_MODULE}.strip_str_op:StripStrOp",
+    "lstrip_str": f"{_MODULE}.lstrip_str_op:LstripStrOp",
+    "rstrip_str": f"{_MODULE}.rstrip_str_op:RstripStrOp",
+    "expandtabs_str": f"{_MODULE}.expandtabs_str_op:ExpandtabsStrOp",
 }
 
 
@@ -39,13 +33,13 @@ def list_string_op_types() -> tuple[str, ...]:
 
 
 def get_string_op_cls(op_type: str) -> StringOpClass:
-    op_cls = STRING_OP_REGISTRY.get(op_type)
-    if op_cls is None:
+    target = STRING_OP_REGISTRY.get(op_type)
+    if target is None:
         supported = ", ".join(list_string_op_types())
         raise ValueError(
             f"Unknown string op_type '{op_type}'. Supported: {supported}"
         )
-    return op_cls
+    return import_target(target)
 
 
 def build_string_op(op_type: str, **kwargs: Any) -> BaseOp:
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Literal, cast
+from collections.abc import Sequence
+from typing import Any, ClassVar, Literal, cast
 
 from pydantic import Field
 
+from genfxn.ops.algebra import OpAlgebra
 from genfxn.ops.base_op import BaseOp
+from genfxn.ops.ir import Const, Expr, guarded
 from genfxn.spaces.string_space import StringSpace
-from genfxn.templates.str_templates import (
-    eval_guarded_str_expr,
-    render_guarded_str_expr,
-)
+from genfxn.templates.str_templates import eval_guarded_str_expr
 from genfxn.types import DEFAULT_STR_INPUT_VAR
 
 
@@ -18,11 +18,46 @@ class TabStrOp(BaseOp):
 
     op_type: Literal["tab_str"] = "tab_str"
     input_space: StringSpace = Field(default_factory=StringSpace)
+    algebra: ClassVar[OpAlgebra] = OpAlgebra(
+        idempotent=True,
+        # Case ops, reverse and expandtabs keep strings non-empty.
+        absorbs_preceding=frozenset(
+            {
+                "lower_str",
+                "upper_str",
+                "casefold_str",
+                "swapcase_str",
+                "capitalize_str",
+                "title_str",
+                "reverse_str",
+                "expandtabs_str",
+            }
+        ),
+        # "\t" is fixed by case ops and reverse.
+        absorbs_following=frozenset(
+            {
+                "lower_str",
+                "upper_str",
+                "casefold_str",
+                "swapcase_str",
+                "capitalize_str",
+                "title_str",
+                "reverse_str",
+            }
+        ),
+    )
 
     def eval(self, **kwargs: Any) -> str:
         self.validate_input(**kwargs)
         input = cast(str, kwargs[DEFAULT_STR_INPUT_VAR])
         return eval_guarded_str_expr(input, lambda _: "\t")
 
-    def render_python(self) -> str:
-        return render_guarded_str_expr(r"'\t'")
+    def eval_many(
+        self, inputs: Sequence[str], *, validate: bool = True
+    ) -> list[str]:
+        if validate:
+            self.validate_inputs(inputs)
+        return ["\t" if input else input for input in inputs]
+
+    def build_ir(self) -> Expr:
+        return guarded(Const("\t"))
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+import random
+from collections.abc import Callable, Sequence
+
+# Block size of keyed streams over cheap draws (scalar spaces, mixture
+# indices). A stream's block size is part of its format: changing it
+# changes every keyed sample drawn with it.
+STREAM_BLOCK_SIZE = 1_024
+
+
+def stream_seed(seed: int, index: int) -> int:
+    """Derive the seed of the independent stream keyed by (seed, index)."""
+    digest = hashlib.blake2b(
+        f"{seed}:{index}".encode(), digest_size=16
+    ).digest()
+    return int.from_bytes(digest)
+
+
+def stream_rng(seed: int, index: int) -> random.Random:
+    """Return a fresh RNG for the stream keyed by (seed, index).
+
+    Streams depend only on their key, so work split by index range
+    reproduces exactly what a single sequential pass would draw.
+    """
+    return random.Random(stream_seed(seed, index))
+
+
+def draw_keyed[T](
+    draw: Callable[[int, random.Random], Sequence[T]],
+    seed: int,
+    start: int,
+    stop: int,
+    block_size: int = STREAM_BLOCK_SIZE,
+) -> list[T]:
+    """Return items [start, stop) of the (seed, block)-keyed stream.
+
+    Item i is item ``i % block_size`` of
+    ``draw(block_size, stream_rng(seed, i // block_size))``, so one RNG
+    serves a whole block and any partition of the indices yields the
+    same items. Slices aligned to the block size draw each block once;
+    others also draw the blocks they cut through. Use block_size=1 when
+    single draws are expensive, so random access draws only the items
+    asked for.
+    """
+    if start < 0 or stop < start:
+        raise ValueError("expected 0 <= start <= stop")
+    if block_size < 1:
+        raise ValueError("block_size must be >= 1")
+    items: list[T] = []
+    if start == stop:
+        return items
+    first_block = start // block_size
+    last_block = (stop - 1) // block_size
+    for block in range(first_block, last_block + 1):
+        offset = block * block_size
+        values = draw(block_size, stream_rng(seed, block))
+        items.extend(values[max(start - offset, 0) : stop - offset])
+    return items
+
+
+def fork_rng(rng: random.Random) -> random.Random:
+    """Return an independent RNG starting from rng's current state."""
+    forked = random.Random()
+    forked.setstate(rng.getstate())
+    return forked
@@ -1,24 +1,46 @@
 from __future__ import annotations
 
+import itertools
 import math
 import random
-from typing import Any, Literal
+from collections.abc import Callable, Hashable, Iterator, Mapping, Sequence
+from functools import cached_property
+from typing import Any, ClassVar, Literal, Self
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
 
-from genfxn.spaces.space import get_single_kwarg_value
+from genfxn.rng import STREAM_BLOCK_SIZE
+from genfxn.spaces.space import (
+    DEFAULT_SAMPLE_CHUNK_SIZE,
+    drop_cached_properties,
+    get_single_kwarg_value,
+    iter_sample_chunks,
+)
 
 CategoricalValue = str | int | float | bool | None
 
 
 class CategoricalSpace(BaseModel):
-    """A finite, ordered categorical value space."""
+    """A finite, ordered categorical value space.
+
+    Sampling is uniform unless per-value ``weights`` are given.
+    """
 
     kind: Literal["categorical"] = "categorical"
     values: tuple[CategoricalValue, ...] = Field(min_length=1)
+    weights: tuple[float, ...] | None = None
 
     model_config = ConfigDict(extra="forbid", frozen=True)
 
+    # Single draws are cheap, so keyed sampling draws whole blocks.
+    keyed_block_size: ClassVar[int] = STREAM_BLOCK_SIZE
+
     @field_validator("values")
     @classmethod
     def validate_values(
@@ -37,17 +59,122 @@ class CategoricalSpace(BaseModel):
             seen.add(key)
         return values
 
+    @model_validator(mode="after")
+    def validate_weights(self) -> CategoricalSpace:
+        if self.weights is None:
+            return self
+        if len(self.weights) != len(self.values):
+            raise ValueError("weights length must match values length")
+        if any(not (math.isfinite(w) and w > 0) for w in self.weights):
+            raise ValueError("weights must be finite and > 0")
+        return self
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        drop_cached_properties(copied)
+        return copied
+
+    @cached_property
+    def _cum_weights(self) -> tuple[float, ...] | None:
+        # Unit weights give cum_weights 1.0..n, which rng.choices draws
+        # exactly like unweighted choices but without the bisect.
+        if self.weights is None or all(w == 1.0 for w in self.weights):
+            return None
+        return tuple(itertools.accumulate(self.weights))
+
+    @cached_property
+    def _member_keys(self) -> frozenset[tuple[type[object], CategoricalValue]]:
+        return frozenset((type(value), value) for value in self.values)
+
     def validate_member(self, **kwargs: Any) -> None:
         value = get_single_kwarg_value(kwargs)
-        for candidate in self.values:
-            if type(candidate) is type(value) and candidate == value:
+        try:
+            if (type(value), value) in self._member_keys:
                 return
+        except TypeError:
+            pass  # Unhashable values can never be members.
         raise ValueError(f"value {value!r} is not a member of this space")
 
+    def validate_members(self, values: Sequence[Any]) -> None:
+        for value in values:
+            self.validate_member(value=value)
+
+    def sample_indices(self, n_samples: int, rng: random.Random) -> list[int]:
+        """Draw n_samples value indices, consuming rng like sample."""
+        return self.sample_from(range(len(self.values)), n_samples, rng)
+
+    def sample_from[T](
+        self, population: Sequence[T], n_samples: int, rng: random.Random
+    ) -> list[T]:
+        """Draw like sample, returning population[i] for each value index i.
+
+        population must have one item per value.
+        """
+        if n_samples < 0:
+            raise ValueError("n_samples must be >= 0")
+        if len(population) != len(self.values):
+            raise ValueError("population length must match values length")
+
+        return rng.choices(
+            population, cum_weights=self._cum_weights, k=n_samples
+        )
+
     def sample(
         self, n_samples: int, rng: random.Random
     ) -> list[CategoricalValue]:
         if n_samples < 0:
             raise ValueError("n_samples must be >= 0")
 
-        return rng.choices(self.values, k=n_samples)
+        return rng.choices(
+            self.values, cum_weights=self._cum_weights, k=n_samples
+        )
+
+    def enumerate(self) -> Sequence[CategoricalValue]:
+        """Return every value in order, with O(1) access by index."""
+        return self.values
+
+    def stratified_sample(
+        self,
+        n_samples: int,
+        rng: random.Random,
+        strata: Callable[[CategoricalValue], Hashable] | None = None,
+    ) -> list[CategoricalValue]:
+        """Sample n_samples values spread evenly across strata.
+
+        Values are grouped by ``strata(value)`` (by default every value is
+        its own stratum). Each stratum gets n_samples // n_strata draws and
+        the remainder goes to distinct, randomly chosen strata. Draws
+        within a stratum follow the space's weights. Results are grouped
+        by stratum in order of first appearance in ``values``.
+        """
+        if n_samples < 0:
+            raise ValueError("n_samples must be >= 0")
+
+        groups: dict[Hashable, list[int]] = {}
+        for idx, value in enumerate(self.values):
+            key = value if strata is None else strata(value)
+            groups.setdefault((type(key), key), []).append(idx)
+
+        quota, remainder = divmod(n_samples, len(groups))
+        extra = set(rng.sample(range(len(groups)), remainder))
+        samples: list[CategoricalValue] = []
+        for stratum_idx, indices in enumerate(groups.values()):
+            k = quota + (stratum_idx in extra)
+            weights = (
+                None
+                if self.weights is None
+                else [self.weights[idx] for idx in indices]
+            )
+            chosen = rng.choices(indices, weights=weights, k=k)
+            samples.extend(self.values[idx] for idx in chosen)
+        return samples
+
+    def iter_samples(
+        self,
+        n_samples: int,
+        rng: random.Random,
+        chunk_size: int = DEFAULT_SAMPLE_CHUNK_SIZE,
+    ) -> Iterator[CategoricalValue]:
+        return iter_sample_chunks(self, n_samples, rng, chunk_size)
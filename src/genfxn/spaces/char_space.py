@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+from functools import cached_property
+from typing import Literal, cast
 
 from pydantic import model_validator
 
@@ -26,3 +27,17 @@ class CharSpace(CategoricalSpace):
                     f"CharSpace values must be single characters, got {value!r}"
                 )
         return self
+
+    @cached_property
+    def _deletion_table(self) -> dict[int, None]:
+        return dict.fromkeys(ord(cast(str, value)) for value in self.values)
+
+    def validate_chars(self, value: str) -> None:
+        """Raise ValueError unless every char of value is a member.
+
+        Members are deleted in a single str.translate pass; only a
+        non-empty remainder falls back to per-char checks for the error.
+        """
+        if value.translate(self._deletion_table):
+            for ch in value:
+                self.validate_member(value=ch)
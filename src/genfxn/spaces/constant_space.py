@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import math
 import random
-from typing import Any, Literal
+from collections.abc import Iterator, Sequence
+from typing import Any, ClassVar, Literal
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
-from genfxn.spaces.space import get_single_kwarg_value
+from genfxn.rng import STREAM_BLOCK_SIZE
+from genfxn.spaces.space import (
+    DEFAULT_SAMPLE_CHUNK_SIZE,
+    get_single_kwarg_value,
+    iter_sample_chunks,
+)
 
 ConstantValue = str | int | float | bool | None
 
@@ -19,6 +25,8 @@ class ConstantSpace(BaseModel):
 
     model_config = ConfigDict(extra="forbid", frozen=True)
 
+    keyed_block_size: ClassVar[int] = STREAM_BLOCK_SIZE
+
     @field_validator("value")
     @classmethod
     def validate_value(cls, value: ConstantValue) -> ConstantValue:
@@ -34,8 +42,20 @@ class ConstantSpace(BaseModel):
             f"value {candidate!r} is not equal to constant {self.value!r}"
         )
 
+    def validate_members(self, values: Sequence[Any]) -> None:
+        for value in values:
+            self.validate_member(value=value)
+
     def sample(self, n_samples: int, rng: random.Random) -> list[ConstantValue]:
         del rng
         if n_samples < 0:
             raise ValueError("n_samples must be >= 0")
         return [self.value for _ in range(n_samples)]
+
+    def iter_samples(
+        self,
+        n_samples: int,
+        rng: random.Random,
+        chunk_size: int = DEFAULT_SAMPLE_CHUNK_SIZE,
+    ) -> Iterator[ConstantValue]:
+        return iter_sample_chunks(self, n_samples, rng, chunk_size)
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import itertools
+import math
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any, overload
+
+
+class IndexedProduct(Sequence[Any]):
+    """Lazy cross product of finite sequences with O(1) random access.
+
+    Items are ordered like itertools.product (last factor varies
+    fastest), so index ranges give deterministic, disjoint shards of a
+    full sweep. If ``build`` is given, each item is ``build(*combo)``
+    instead of the raw combo tuple.
+    """
+
+    def __init__(
+        self,
+        factors: Sequence[Sequence[Any]],
+        build: Callable[..., Any] | None = None,
+    ) -> None:
+        self._factors = tuple(factors)
+        self._build = build
+        self._len = math.prod(len(factor) for factor in self._factors)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _item(self, combo: tuple[Any, ...]) -> Any:
+        return combo if self._build is None else self._build(*combo)
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Any]: ...
+
+    def __getitem__(self, index: int | slice) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("IndexedProduct index out of range")
+
+        combo: list[Any] = []
+        for factor in reversed(self._factors):
+            index, pos = divmod(index, len(factor))
+            combo.append(factor[pos])
+        return self._item(tuple(reversed(combo)))
+
+    def __iter__(self) -> Iterator[Any]:
+        for combo in itertools.product(*self._factors):
+            yield self._item(combo)
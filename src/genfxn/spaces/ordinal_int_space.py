@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 import random
+from collections.abc import Iterator
 from typing import Any, Literal
 
 from pydantic import Field, model_validator
 
 from genfxn.spaces.ordinal_space import OrdinalSpace
-from genfxn.spaces.space import get_single_kwarg_value
+from genfxn.spaces.space import (
+    DEFAULT_SAMPLE_CHUNK_SIZE,
+    get_single_kwarg_value,
+)
 from genfxn.types import DEFAULT_MAX_STR_LEN, DEFAULT_MIN_STR_LEN
 
 
@@ -23,8 +27,22 @@ class OrdinalIntSpace(OrdinalSpace):
             raise ValueError(f"high ({self.high}) must be >= low ({self.low})")
         return self
 
-    def ordered_values(self) -> tuple[int, ...]:
-        return tuple(range(self.low, self.high + 1))
+    def ordered_values(self) -> range:
+        return range(self.low, self.high + 1)
+
+    def size(self) -> int:
+        return self.high - self.low + 1
+
+    def contains(self, value: Any) -> bool:
+        return (
+            isinstance(value, int)
+            and not isinstance(value, bool)
+            and self.low <= value <= self.high
+        )
+
+    def index_of(self, value: Any) -> int:
+        self.validate_member(value=value)
+        return value - self.low
 
     def validate_member(self, **kwargs: Any) -> None:
         value = get_single_kwarg_value(kwargs)
@@ -39,3 +57,15 @@ class OrdinalIntSpace(OrdinalSpace):
         if n_samples < 0:
             raise ValueError("n_samples must be >= 0")
         return [rng.randint(self.low, self.high) for _ in range(n_samples)]
+
+    def iter_samples(
+        self,
+        n_samples: int,
+        rng: random.Random,
+        chunk_size: int = DEFAULT_SAMPLE_CHUNK_SIZE,
+    ) -> Iterator[int]:
+        del chunk_size  # Values are drawn one at a time.
+        if n_samples < 0:
+            raise ValueError("n_samples must be >= 0")
+        for _ in range(n_samples):
+            yield rng.randint(self.low, self.high)
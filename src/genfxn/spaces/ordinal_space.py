@@ -2,11 +2,17 @@ from __future__ import annotations
 
 import random
 from abc import ABC, abstractmethod
-from typing import Any
+from collections.abc import Iterator, Sequence
+from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict
 
-from genfxn.spaces.space import get_single_kwarg_value
+from genfxn.rng import STREAM_BLOCK_SIZE
+from genfxn.spaces.space import (
+    DEFAULT_SAMPLE_CHUNK_SIZE,
+    get_single_kwarg_value,
+    iter_sample_chunks,
+)
 
 
 class OrdinalSpace(BaseModel, ABC):
@@ -19,17 +25,55 @@ class OrdinalSpace(BaseModel, ABC):
 
     model_config = ConfigDict(extra="forbid", frozen=True)
 
+    # Single draws are cheap, so keyed sampling draws whole blocks.
+    keyed_block_size: ClassVar[int] = STREAM_BLOCK_SIZE
+
     @abstractmethod
-    def ordered_values(self) -> tuple[Any, ...]:
-        """Return all values in order from low to high."""
+    def ordered_values(self) -> Sequence[Any]:
+        """Return all values in order from low to high.
+
+        Subclasses over large ranges should return a lazy sequence
+        (e.g. a range) rather than materializing every value.
+        """
+
+    def size(self) -> int:
+        return len(self.ordered_values())
+
+    def contains(self, value: Any) -> bool:
+        return value in self.ordered_values()
+
+    def index_of(self, value: Any) -> int:
+        """Return the rank of value, raising ValueError for non-members."""
+        try:
+            return self.ordered_values().index(value)
+        except ValueError:
+            raise ValueError(
+                f"value {value!r} is not in this ordinal space"
+            ) from None
+
+    def value_at(self, index: int) -> Any:
+        """Return the value at rank index (negative indices count back)."""
+        return self.ordered_values()[index]
 
     def validate_member(self, **kwargs: Any) -> None:
         value = get_single_kwarg_value(kwargs)
-        if value not in self.ordered_values():
+        if not self.contains(value):
             raise ValueError(f"value {value!r} is not in this ordinal space")
 
+    def validate_members(self, values: Sequence[Any]) -> None:
+        for value in values:
+            self.validate_member(value=value)
+
     def sample(self, n_samples: int, rng: random.Random) -> list[Any]:
         if n_samples < 0:
             raise ValueError("n_samples must be >= 0")
         values = self.ordered_values()
         return rng.choices(values, k=n_samples)
+
+    def iter_samples(
+        self,
+        n_samples: int,
+        rng: random.Random,
+        chunk_size: int = DEFAULT_SAMPLE_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        return iter_sample_chunks(self, n_samples, rng, chunk_size)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+from collections.abc import Mapping
+from functools import cached_property
+from typing import Any, Literal, Self
 
 from pydantic import Field, model_validator
 
 from genfxn.spaces.ordinal_space import OrdinalSpace
+from genfxn.spaces.space import drop_cached_properties
 
 
 class OrdinalStringSpace(OrdinalSpace):
@@ -24,16 +27,36 @@ class OrdinalStringSpace(OrdinalSpace):
             raise ValueError("values must be unique")
         return self
 
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        drop_cached_properties(copied)
+        return copied
+
+    @cached_property
+    def _ranks(self) -> dict[str, int]:
+        return {value: rank for rank, value in enumerate(self.values)}
+
     def ordered_values(self) -> tuple[str, ...]:
         return self.values
 
+    def contains(self, value: Any) -> bool:
+        return isinstance(value, str) and value in self._ranks
+
+    def index_of(self, value: Any) -> int:
+        """Return the rank of value, raising ValueError for non-members."""
+        if not self.contains(value):
+            raise ValueError(f"value {value!r} is not in this ordinal space")
+        return self._ranks[value]
+
     def validate_member(self, **kwargs: Any) -> None:
         from genfxn.spaces.space import get_single_kwarg_value
 
         value = get_single_kwarg_value(kwargs)
         if not isinstance(value, str):
             raise ValueError(f"value must be a string, got {type(value)}")
-        if value not in self.values:
+        if value not in self._ranks:
             raise ValueError(
                 f"value {value!r} is not in this ordinal space"
             )
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any
+
+from genfxn.rng import STREAM_BLOCK_SIZE
+from genfxn.spaces.space import Space, sample_keyed
+
+DEFAULT_PARALLEL_CHUNK_SIZE = STREAM_BLOCK_SIZE
+
+_worker_space: Space | None = None
+
+
+def _init_worker(space: Space) -> None:
+    global _worker_space
+    _worker_space = space
+
+
+def _sample_chunk(seed: int, start: int, stop: int) -> list[Any]:
+    if _worker_space is None:
+        raise RuntimeError("sampling worker was not initialized")
+    return sample_keyed(_worker_space, seed, start, stop)
+
+
+def sample_parallel(
+    space: Space,
+    n_samples: int,
+    seed: int,
+    *,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_PARALLEL_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """Yield sample_keyed(space, seed, 0, n_samples) using a process pool.
+
+    The space is pickled once per worker. Chunks of ``chunk_size``
+    indices are sampled concurrently and yielded in index order, with at
+    most two chunks per worker in flight so memory stays bounded when
+    the consumer is slower than the pool. Keep chunk_size a multiple of
+    the space's keyed_block_size (STREAM_BLOCK_SIZE for scalar spaces)
+    so no keyed block is drawn twice.
+    """
+    if n_samples < 0:
+        raise ValueError("n_samples must be >= 0")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    starts = iter(range(0, n_samples, chunk_size))
+    pending: deque[Future[list[Any]]] = deque()
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(space,),
+    )
+
+    def submit_next() -> None:
+        start = next(starts, None)
+        if start is not None:
+            stop = min(start + chunk_size, n_samples)
+            pending.append(pool.submit(_sample_chunk, seed, start, stop))
+
+    try:
+        for _ in range(2 * workers):
+            submit_next()
+        while pending:
+            chunk = pending.popleft().result()
+            submit_next()
+            yield from chunk
+    finally:
+        # Drop queued chunks if the consumer stops early.
+        pool.shutdown(wait=True, cancel_futures=True)
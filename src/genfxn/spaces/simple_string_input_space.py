@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import operator
 import random
 import string
-from typing import cast
+from collections.abc import Iterator, Mapping
+from functools import cached_property
+from typing import Any, Self, cast
 
 from pydantic import Field, model_validator
 
@@ -11,8 +14,13 @@ from genfxn.spaces.ascii_char_space import AsciiCharSpace
 from genfxn.spaces.categorical_space import CategoricalSpace
 from genfxn.spaces.char_space import CharSpace
 from genfxn.spaces.ordinal_int_space import OrdinalIntSpace
-from genfxn.spaces.space import Space
-from genfxn.spaces.string_space import StringSpace
+from genfxn.spaces.space import (
+    DEFAULT_SAMPLE_CHUNK_SIZE,
+    Space,
+    drop_cached_properties,
+)
+from genfxn.spaces.string_space import StringSpace, iter_presampled
+from genfxn.trusted import construct_trusted
 from genfxn.types import (
     DEFAULT_MAX_STR_LEN,
     DEFAULT_MIN_STR_LEN,
@@ -32,9 +40,10 @@ def _single_char_lower_str_space() -> StringSpace:
 
 
 def _core_style_mixture() -> MixtureOp:
-    return MixtureOp(
+    return construct_trusted(
+        MixtureOp,
         choices=("lower_str", "upper_str", "tab_str"),
-        weights=[1.0, 1.0, 1.0],
+        weights=(1.0, 1.0, 1.0),
         input_space=_single_char_lower_str_space(),
     )
 
@@ -58,18 +67,25 @@ class SimpleStringInputSpace(StringSpace):
 
     @model_validator(mode="after")
     def validate_sampler_spaces(self) -> SimpleStringInputSpace:
-        AsciiCharSpace.validate_space(
-            self.core_letter_space,
-            field_name="core_letter_space",
-            require_alpha=True,
-        )
+        # Field defaults satisfy these checks by construction; only
+        # explicitly passed fields (and their combinations) are checked.
+        explicit = self.model_fields_set
+        if "core_letter_space" in explicit:
+            AsciiCharSpace.validate_space(
+                self.core_letter_space,
+                field_name="core_letter_space",
+                require_alpha=True,
+            )
 
-        AsciiCharSpace.validate_space(
-            self.pad_space,
-            field_name="pad_space",
-            allow_multi_char=True,
-        )
+        if "pad_space" in explicit:
+            AsciiCharSpace.validate_space(
+                self.pad_space,
+                field_name="pad_space",
+                allow_multi_char=True,
+            )
 
+        if explicit.isdisjoint(("core_letter_space", "core_style_mixture")):
+            return self
         for value in self.core_letter_space.values:
             self.core_style_mixture.validate_input(
                 **{DEFAULT_STR_INPUT_VAR: value}
@@ -77,6 +93,44 @@ class SimpleStringInputSpace(StringSpace):
 
         return self
 
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        drop_cached_properties(copied)
+        return copied
+
+    @cached_property
+    def _styled_char_table(self) -> tuple[str, ...]:
+        """Mixture outputs indexed by ``letter_idx * n_styles + style_idx``.
+
+        Leaf ops are deterministic per letter, so every styled char the
+        sampler can emit is computed once instead of per char.
+        """
+        table: list[str] = []
+        for letter in self.core_letter_space.values:
+            for op in self.core_style_mixture.resolved_ops:
+                styled = cast(str, op.eval(**{DEFAULT_STR_INPUT_VAR: letter}))
+                table.append(styled)
+        return tuple(table)
+
+    @cached_property
+    def _letter_offsets(self) -> range:
+        """Offset of each letter's row in _styled_char_table."""
+        n_styles = len(self.core_style_mixture.choices)
+        return range(0, len(self._styled_char_table), n_styles)
+
+    def _sample_core(self, core_len: int, rng: random.Random) -> str:
+        # Same draw order as sampling core_len letters and then evaluating
+        # the mixture once per letter; letters are drawn straight as
+        # table offsets.
+        letters = self.core_letter_space.sample_from(
+            self._letter_offsets, core_len, rng
+        )
+        styles = self.core_style_mixture.sample_choice_indices(core_len, rng)
+        table = self._styled_char_table
+        return "".join([table[i] for i in map(operator.add, letters, styles)])
+
     def sample(self, n_samples: int, rng: random.Random) -> list[str]:
         if n_samples < 0:
             raise ValueError("n_samples must be >= 0")
@@ -84,25 +138,34 @@ class SimpleStringInputSpace(StringSpace):
         lengths = cast(list[int], self.core_length_space.sample(n_samples, rng))
         left_pads = cast(list[str], self.pad_space.sample(n_samples, rng))
         right_pads = cast(list[str], self.pad_space.sample(n_samples, rng))
-        core_style_mixture = self.core_style_mixture.model_copy(
-            update={"rng": rng}
-        )
 
         samples: list[str] = []
         for i, core_len in enumerate(lengths):
-            core_letters = cast(
-                list[str], self.core_letter_space.sample(core_len, rng)
-            )
-            core_chars = [
-                cast(
-                    str,
-                    core_style_mixture.eval(**{DEFAULT_STR_INPUT_VAR: letter}),
-                )
-                for letter in core_letters
-            ]
-
-            sampled = f"{left_pads[i]}{''.join(core_chars)}{right_pads[i]}"
+            core = self._sample_core(core_len, rng)
+            sampled = f"{left_pads[i]}{core}{right_pads[i]}"
             self.validate_member(**{DEFAULT_STR_INPUT_VAR: sampled})
             samples.append(sampled)
 
         return samples
+
+    def iter_samples(
+        self,
+        n_samples: int,
+        rng: random.Random,
+        chunk_size: int = DEFAULT_SAMPLE_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        if n_samples < 0:
+            raise ValueError("n_samples must be >= 0")
+
+        lengths = iter_presampled(
+            self.core_length_space, n_samples, rng, chunk_size
+        )
+        left_pads = iter_presampled(self.pad_space, n_samples, rng, chunk_size)
+        right_pads = iter_presampled(self.pad_space, n_samples, rng, chunk_size)
+        for core_len, left_pad, right_pad in zip(
+            lengths, left_pads, right_pads, strict=True
+        ):
+            core = self._sample_core(core_len, rng)
+            sampled = f"{left_pad}{core}{right_pad}"
+            self.validate_member(**{DEFAULT_STR_INPUT_VAR: sampled})
+            yield sampled
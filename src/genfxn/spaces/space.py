@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 import random
+from collections.abc import Iterator, Sequence
+from functools import cached_property
 from typing import Any, Protocol, runtime_checkable
 
+from genfxn.rng import draw_keyed
+
+DEFAULT_SAMPLE_CHUNK_SIZE = 1_024
+
 
 def get_single_kwarg_value(kwargs: dict[str, Any]) -> object:
     if len(kwargs) != 1:
@@ -10,6 +16,18 @@ def get_single_kwarg_value(kwargs: dict[str, Any]) -> object:
     return next(iter(kwargs.values()))
 
 
+def drop_cached_properties(model: Any) -> None:
+    """Forget every cached_property value stored on model.
+
+    Used by model_copy: cached indexes belong to the original's fields
+    and would go stale under ``update``.
+    """
+    for cls in type(model).__mro__:
+        for name, attr in vars(cls).items():
+            if isinstance(attr, cached_property):
+                model.__dict__.pop(name, None)
+
+
 @runtime_checkable
 class Space(Protocol):
     """Common interface for all value spaces."""
@@ -17,5 +35,48 @@ class Space(Protocol):
     def validate_member(self, **kwargs: Any) -> None:
         """Raise ValueError if value is not in the space."""
 
+    def validate_members(self, values: Sequence[Any]) -> None:
+        """Raise ValueError if any of values is not in the space."""
+
     def sample(self, n_samples: int, rng: random.Random) -> list[Any]:
         """Sample n_samples IID values from the space."""
+
+    def iter_samples(
+        self,
+        n_samples: int,
+        rng: random.Random,
+        chunk_size: int = DEFAULT_SAMPLE_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """Lazily yield what sample(n_samples, rng) would return.
+
+        Consumes rng in the same order as sample, holding at most about
+        chunk_size samples in memory at once.
+        """
+
+
+def iter_sample_chunks(
+    space: Space, n_samples: int, rng: random.Random, chunk_size: int
+) -> Iterator[Any]:
+    """Yield space.sample in chunks of chunk_size.
+
+    Only valid for spaces whose sample draws each value in turn, so that
+    consecutive calls consume rng exactly like one call would.
+    """
+    if n_samples < 0:
+        raise ValueError("n_samples must be >= 0")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    for start in range(0, n_samples, chunk_size):
+        yield from space.sample(min(chunk_size, n_samples - start), rng)
+
+
+def sample_keyed(space: Space, seed: int, start: int, stop: int) -> list[Any]:
+    """Sample indices [start, stop) of the (seed, index)-keyed stream.
+
+    Samples are drawn a block at a time (see genfxn.rng.draw_keyed), so
+    concatenating any partition of [0, n) into slices yields the same n
+    samples. The block size is the space's ``keyed_block_size``, or 1
+    for spaces that do not set one.
+    """
+    block_size = getattr(space, "keyed_block_size", 1)
+    return draw_keyed(space.sample, seed, start, stop, block_size)
@@ -1,21 +1,45 @@
 from __future__ import annotations
 
 import random
+from collections import deque
+from collections.abc import Iterator, Sequence
 from typing import Any, cast
 
 from pydantic import BaseModel, ConfigDict, Field
 
+from genfxn.rng import fork_rng
 from genfxn.spaces.ascii_char_space import AsciiCharSpace
 from genfxn.spaces.char_space import CharSpace
 from genfxn.spaces.ordinal_int_space import OrdinalIntSpace
+from genfxn.spaces.space import DEFAULT_SAMPLE_CHUNK_SIZE, Space
+from genfxn.string_column import StringColumn
+from genfxn.trusted import shared_default
 from genfxn.types import DEFAULT_STR_INPUT_VAR
 
 
+def iter_presampled(
+    space: Space, n_samples: int, rng: random.Random, chunk_size: int
+) -> Iterator[Any]:
+    """Lazily replay space.iter_samples(n_samples, rng), advancing rng.
+
+    Samplers that draw all n values of a subspace before anything else
+    use this to stream those values from a forked rng, while rng itself
+    is advanced past them without holding them in memory.
+    """
+    replay = space.iter_samples(n_samples, fork_rng(rng), chunk_size)
+    deque(space.iter_samples(n_samples, rng, chunk_size), maxlen=0)
+    return replay
+
+
 class StringSpace(BaseModel):
     """String space composed from length and character spaces."""
 
-    length_space: OrdinalIntSpace = Field(default_factory=OrdinalIntSpace)
-    char_space: CharSpace = Field(default_factory=AsciiCharSpace)
+    length_space: OrdinalIntSpace = Field(
+        default_factory=lambda: shared_default(OrdinalIntSpace)
+    )
+    char_space: CharSpace = Field(
+        default_factory=lambda: shared_default(AsciiCharSpace)
+    )
 
     model_config = ConfigDict(
         extra="forbid",
@@ -37,9 +61,20 @@ class StringSpace(BaseModel):
             raise ValueError("value must be a string")
 
         self.length_space.validate_member(value=len(value))
+        self.char_space.validate_chars(value)
+
+    def validate_members(self, values: Sequence[Any]) -> None:
+        for value in values:
+            if not isinstance(value, str):
+                raise ValueError("value must be a string")
+        if not values:
+            return
 
-        for ch in value:
-            self.char_space.validate_member(value=ch)
+        # Lengths form a contiguous range, so the extremes bound the batch.
+        lengths = list(map(len, values))
+        self.length_space.validate_member(value=min(lengths))
+        self.length_space.validate_member(value=max(lengths))
+        self.char_space.validate_chars("".join(values))
 
     def sample(self, n_samples: int, rng: random.Random) -> list[str]:
         if n_samples < 0:
@@ -52,3 +87,32 @@ class StringSpace(BaseModel):
             samples.append("".join(chars))
 
         return samples
+
+    def iter_samples(
+        self,
+        n_samples: int,
+        rng: random.Random,
+        chunk_size: int = DEFAULT_SAMPLE_CHUNK_SIZE,
+    ) -> Iterator[str]:
+        if n_samples < 0:
+            raise ValueError("n_samples must be >= 0")
+
+        lengths = iter_presampled(self.length_space, n_samples, rng, chunk_size)
+        for length in lengths:
+            chars = cast(list[str], self.char_space.sample(length, rng))
+            yield "".join(chars)
+
+    def sample_column(
+        self,
+        n_samples: int,
+        rng: random.Random,
+        chunk_size: int = DEFAULT_SAMPLE_CHUNK_SIZE,
+    ) -> StringColumn:
+        """Sample like sample(), packed into a StringColumn.
+
+        Samples stream straight into the column buffer, so no list of
+        str objects is ever held. Requires ASCII samples.
+        """
+        return StringColumn.from_strings(
+            self.iter_samples(n_samples, rng, chunk_size)
+        )
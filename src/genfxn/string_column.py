@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import itertools
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import overload
+
+
+class StringColumn(Sequence[str]):
+    """Batch of ASCII strings stored as one data buffer plus offsets.
+
+    String i is ``data[offsets[i]:offsets[i + 1]]``, as in Arrow string
+    arrays. ASCII keeps chars and bytes one-to-one. Contiguous slices are
+    zero-copy views that share both buffers.
+    """
+
+    __slots__ = ("_data", "_offsets", "_start", "_stop")
+
+    def __init__(
+        self,
+        data: bytes,
+        offsets: array,
+        start: int = 0,
+        stop: int | None = None,
+    ) -> None:
+        if offsets.typecode != "q" or len(offsets) == 0:
+            raise ValueError("offsets must be a non-empty array('q')")
+        if stop is None:
+            stop = len(offsets) - 1
+        if not 0 <= start <= stop < len(offsets):
+            raise ValueError("expected 0 <= start <= stop < len(offsets)")
+        self._data = data
+        self._offsets = offsets
+        self._start = start
+        self._stop = stop
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str]) -> StringColumn:
+        """Pack ASCII strings, streaming when given a lazy iterable."""
+        try:
+            if isinstance(strings, list | tuple):
+                data = "".join(strings).encode("ascii")
+                offsets = array(
+                    "q", itertools.accumulate(map(len, strings), initial=0)
+                )
+                return cls(data, offsets)
+
+            offsets = array("q", [0])
+            buffer = bytearray()
+            for value in strings:
+                buffer += value.encode("ascii")
+                offsets.append(len(buffer))
+        except UnicodeEncodeError as exc:
+            raise ValueError("StringColumn values must be ASCII") from exc
+        return cls(bytes(buffer), offsets)
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> StringColumn: ...
+
+    def __getitem__(self, index: int | slice) -> str | StringColumn:
+        n_items = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n_items)
+            if step != 1:
+                return StringColumn.from_strings(
+                    [self[i] for i in range(start, stop, step)]
+                )
+            stop = max(start, stop)
+            return StringColumn(
+                self._data,
+                self._offsets,
+                self._start + start,
+                self._start + stop,
+            )
+
+        if index < 0:
+            index += n_items
+        if not 0 <= index < n_items:
+            raise IndexError("StringColumn index out of range")
+        pos = self._start + index
+        begin, end = self._offsets[pos], self._offsets[pos + 1]
+        return self._data[begin:end].decode("ascii")
+
+    def __iter__(self) -> Iterator[str]:
+        data = self._data
+        bounds = memoryview(self._offsets)[self._start : self._stop + 1]
+        for begin, end in itertools.pairwise(bounds):
+            yield data[begin:end].decode("ascii")
+
+    def __eq__(self, other: object) -> bool:
+        """Compare string lengths and data bytes, without decoding."""
+        if not isinstance(other, StringColumn):
+            return NotImplemented
+        if len(self) != len(other) or self.nbytes != other.nbytes:
+            return False
+        data, offsets = self.buffers()
+        other_data, other_offsets = other.buffers()
+        base, other_base = offsets[0], other_offsets[0]
+        if base == other_base:
+            same_lengths = offsets == other_offsets
+        else:
+            shift = other_base - base
+            same_lengths = all(
+                end + shift == other_end
+                for end, other_end in zip(offsets, other_offsets)
+            )
+        nbytes = self.nbytes
+        return (
+            same_lengths
+            and data[base : base + nbytes]
+            == other_data[other_base : other_base + nbytes]
+        )
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"StringColumn(len={len(self)}, nbytes={self.nbytes})"
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes of string data covered by this column."""
+        return self._offsets[self._stop] - self._offsets[self._start]
+
+    def buffers(self) -> tuple[memoryview, memoryview]:
+        """Return zero-copy (data, offsets) views.
+
+        The offsets view has len(self) + 1 entries indexing into the
+        data view.
+        """
+        return (
+            memoryview(self._data),
+            memoryview(self._offsets)[self._start : self._stop + 1],
+        )
+
+    def to_list(self) -> list[str]:
+        """Decode all strings with a single decode of the data buffer."""
+        base = self._offsets[self._start]
+        text = self._data[base : self._offsets[self._stop]].decode("ascii")
+        bounds = memoryview(self._offsets)[self._start : self._stop + 1]
+        return [
+            text[begin - base : end - base]
+            for begin, end in itertools.pairwise(bounds)
+        ]
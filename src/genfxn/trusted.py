@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import cache
+from typing import Any
+
+from pydantic import BaseModel
+
+
+@cache
+def shared_default[ModelT: BaseModel](cls: type[ModelT]) -> ModelT:
+    """Return one shared default instance of a frozen, hashable model.
+
+    Use as a default_factory so defaults are built and validated once
+    rather than per parent instance.
+    """
+    return cls()
+
+
+@cache
+def _trusted_default(
+    cls: type[BaseModel], name: str
+) -> Callable[[], Any] | None:
+    """Return a zero-arg factory for a field's default, or None.
+
+    Frozen, hashable model defaults are built once and shared: they are
+    immutable values, the same criterion get_op uses for interning.
+    Other factory defaults (RNGs, dicts, models holding a mixture) are
+    called per instance; plain defaults are left to model_construct.
+    """
+    field = cls.model_fields[name]
+    factory = field.default_factory
+    if factory is None or field.default_factory_takes_validated_data:
+        return None
+    value = factory()  # type: ignore[call-arg]
+    if not isinstance(value, BaseModel) or not value.model_config.get("frozen"):
+        return factory  # type: ignore[return-value]
+    try:
+        hash(value)
+    except TypeError:
+        return factory  # type: ignore[return-value]
+    return lambda: value
+
+
+def construct_trusted[ModelT: BaseModel](
+    cls: type[ModelT], /, **values: Any
+) -> ModelT:
+    """Build cls from already-validated values without running validators.
+
+    For models produced internally from values that are valid by
+    construction (built-in defaults, enumeration over a validated
+    transform space). Passing unchecked values here bypasses every
+    invariant of the model. Worth it only where validators do real
+    work in Python; pydantic-core validates trivial models faster.
+
+    model_post_init still runs, and models that derive state in an
+    after-validator expose it as ``_resolve_derived``, which is called
+    too. Omitted fields whose default is an immutable model share one
+    instance per class instead of rebuilding and revalidating it.
+    """
+    fields_set = set(values)
+    for name in cls.model_fields:
+        if name in values:
+            continue
+        factory = _trusted_default(cls, name)
+        if factory is not None:
+            values[name] = factory()
+
+    model = cls.model_construct(_fields_set=fields_set, **values)
+    resolve = getattr(cls, "_resolve_derived", None)
+    if resolve is not None:
+        resolve(model)
+    return model
@@ -11,6 +11,8 @@ DEFAULT_STR_INPUT_VAR = "input"
 
 class Lang(StrEnum):
     PYTHON = "python"
+    JAVA = "java"
+    RUST = "rust"
 
 
 class Alphabet(StrEnum):